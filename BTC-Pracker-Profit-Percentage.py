@@ -10,7 +10,9 @@ import numpy as np
 import ctypes
 import matplotlib.dates as mdates
 import sys
+from bisect import bisect_left
 from tkinter import Text, Toplevel, Checkbutton, IntVar
+from pracker_common import HeikinAshiEngine, ui_bus, fetch_async
 
 WINDOW_POSITION_FILE = "window_position.txt"
 BTC_VALUE_FILE = "btc_value.txt"
@@ -59,7 +61,8 @@ def calculate_profit_percentage(avg_price, current_price):
 
 def update_profit_display():
     """Aktualisiere die Gewinn/Verlust-Anzeige."""
-    current_price = get_bitcoin_price_eur()
+    # Zuletzt geladenen Preis nutzen statt eines eigenen blockierenden Requests
+    current_price = last_price or None
     avg_price = load_avg_price()
     
     if current_price is not None and avg_price > 0:
@@ -79,34 +82,38 @@ def calculate_percentage_change(start_price, current_price):
     return ((current_price - start_price) / start_price) * 100
 
 def display_live_percentage_change():
-    """Fetch prices and display live percentage change in green or red based on selected timeframe."""
-    global current_time_range
-
-    # Fetch current price
-    current_price = get_bitcoin_price_eur()
-    if current_price is None:
-        percent_label.config(text="Data Unavailable", fg="grey")
-        return
-    
-    # Fetch historical price based on the selected timeframe
-    historical_prices = get_historical_prices()
-    if historical_prices:
-        start_price = historical_prices[0][1]  # Assuming first price is the oldest price in the timeframe
-    else:
-        percent_label.config(text="Data Unavailable", fg="grey")
-        return
-    
-    # Calculate percentage change
-    percentage_change = calculate_percentage_change(start_price, current_price)
-    
-    # Set color based on positive or negative change
-    color = "#82ef82" if percentage_change >= 0 else "#ff4d4d"
-    
-    # Update the label with the percentage change
-    percent_label.config(text=f"{percentage_change:.2f}%", fg=color)
+    """Fetch prices in the background and post the live percentage change in green or red based on selected timeframe."""
+    def fetch_percentage_change():
+        # Fetch current price
+        current_price = get_bitcoin_price_eur()
+        if current_price is None:
+            ui_bus.post(percent_label, 'text', "Data Unavailable")
+            ui_bus.post(percent_label, 'fg', "grey")
+            return False
+        
+        # Fetch historical price based on the selected timeframe
+        historical_prices = get_historical_prices()
+        if historical_prices:
+            start_price = historical_prices[0][1]  # Assuming first price is the oldest price in the timeframe
+        else:
+            ui_bus.post(percent_label, 'text', "Data Unavailable")
+            ui_bus.post(percent_label, 'fg', "grey")
+            return False
+        
+        # Calculate percentage change
+        percentage_change = calculate_percentage_change(start_price, current_price)
+        
+        # Set color based on positive or negative change
+        color = "#82ef82" if percentage_change >= 0 else "#ff4d4d"
+        
+        # Update the label with the percentage change
+        ui_bus.post(percent_label, 'text', f"{percentage_change:.2f}%")
+        ui_bus.post(percent_label, 'fg', color)
+        return True
     
-    # Repeat this function every 10 seconds
-    percent_label.after(10000, display_live_percentage_change)
+    # Repeat this function every 10 seconds (as before, not after a failed fetch)
+    fetch_async(fetch_percentage_change,
+                lambda ok: ok and percent_label.after(10000, display_live_percentage_change))
 	
 # Function to open a new "Notebook" window
 def open_notebook():
@@ -134,27 +141,8 @@ def open_notebook():
 
     notebook_window.protocol("WM_DELETE_WINDOW", save_notes)  # Save notes on window close
 
-def calculate_heikin_ashi(prices):
-    """Konvertiert normale OHLC-Daten zu Heikin-Ashi"""
-    ha_prices = []
-    
-    for i in range(len(prices)):
-        if i == 0:
-            # Erster Datenpunkt: Nutze Originalwerte
-            ha_open = prices[i][1]  # Erster Preis = Open
-            ha_close = (prices[i][1] + prices[i][2] + prices[i][3] + prices[i][4]) / 4
-            ha_high = prices[i][3]
-            ha_low = prices[i][4]
-        else:
-            # Heikin-Ashi Formeln:
-            ha_close = (prices[i][1] + prices[i][2] + prices[i][3] + prices[i][4]) / 4
-            ha_open = (ha_prices[i-1][1] + ha_prices[i-1][2]) / 2  # Vorheriger HA-Open/Close
-            ha_high = max(prices[i][3], ha_open, ha_close)
-            ha_low = min(prices[i][4], ha_open, ha_close)
-            
-        ha_prices.append((prices[i][0], ha_open, ha_close, ha_high, ha_low))  # (time, open, close, high, low)
-    
-    return ha_prices
+# Heikin-Ashi aus pracker_common: beim ersten Laden vektorisiert, danach O(1) pro neuer Kerze
+ha_engine = HeikinAshiEngine()
 	
 # Default and preset colors
 preset_colors = ["#DAA520", "#62ffc2", "#62edff", "#ff6294", "#ff7e62"]
@@ -386,7 +374,8 @@ def load_btc_value():
 def update_conversion(event=None):
     try:
         btc_amount = float(btc_entry.get())
-        btc_to_eur_rate = get_bitcoin_price_eur()
+        # Zuletzt geladenen Preis nutzen (vor dem ersten Preis 0), nie ein blockierender Request
+        btc_to_eur_rate = last_price
         eur_value = btc_amount * btc_to_eur_rate
         
         # EUR Wert immer in grau anzeigen
@@ -394,7 +383,7 @@ def update_conversion(event=None):
         
         # Berechne Gewinn/Verlust für Prozent-Anzeige
         avg_price = load_avg_price()
-        if avg_price > 0 and btc_to_eur_rate is not None:
+        if avg_price > 0 and btc_to_eur_rate:
             profit_percentage = calculate_profit_percentage(avg_price, btc_to_eur_rate)
             profit_color = "#6FAB65" if profit_percentage >= 0 else "#BD5959"
             # Nur die Prozente mit Farbe anzeigen
@@ -434,20 +423,24 @@ def animate_price_change(label, start_price, end_price, duration=150, steps=50):
     update_price()
 
 def update_price_label(label):
-    """Fetch the current price and animate the price change."""
-    global last_price
-    current_price = get_bitcoin_price_eur()
-    if current_price is not None:
-        # Animate the price change from last_price to current_price
-        animate_price_change(label, last_price, current_price)
-        last_price = current_price  # Update last price to current after animation
+    """Fetch the current price in the background and animate the price change."""
+    def apply_price(current_price):
+        global last_price
+        if current_price is not None:
+            # Animate the price change from last_price to current_price
+            animate_price_change(label, last_price, current_price)
+            last_price = current_price  # Update last price to current after animation
 
-    # Schedule the next update
-    label.after(10000, lambda: update_price_label(label))
+        # Schedule the next update
+        label.after(10000, lambda: update_price_label(label))
+
+    fetch_async(get_bitcoin_price_eur, apply_price)
 
 def plot_historical_prices(ax):
-    historical_data = get_historical_prices()
-    
+    """Lädt die Kerzen im Worker, gezeichnet wird danach im Tk-Thread"""
+    fetch_async(get_historical_prices, lambda historical_data: draw_historical_prices(ax, historical_data))
+
+def draw_historical_prices(ax, historical_data):
     if historical_data:
         dates = [x[0] for x in historical_data]
         opens = [x[1] for x in historical_data]
@@ -456,42 +449,30 @@ def plot_historical_prices(ax):
         closes = [x[4] for x in historical_data]
         
         # Heikin-Ashi Berechnung
-        ha_closes = []
-        ha_opens = []
-        for i in range(len(historical_data)):
-            if i == 0:
-                ha_close = (opens[i] + highs[i] + lows[i] + closes[i]) / 4
-                ha_open = opens[i]
-            else:
-                ha_close = (opens[i] + highs[i] + lows[i] + closes[i]) / 4
-                ha_open = (ha_opens[i-1] + ha_closes[i-1]) / 2
-            ha_closes.append(ha_close)
-            ha_opens.append(ha_open)
+        ha_closes = [x[4] for x in ha_engine.update(historical_data)]
         
         ax.clear()
         ax.set_facecolor('#212121')
 		
 			
         # Zeichne OHLC-Kerzen (dünn)
-        for i in range(len(dates)):
-            color = '#82ef82' if closes[i] >= opens[i] else '#ff4d4d'
-            
-            # Kerzenkörper (sehr dünn)
-            ax.plot([dates[i], dates[i]], 
-                    [opens[i], closes[i]], 
-                    color=color, 
-                    linewidth=1.0,
-                    solid_capstyle='round')
-            
-            # Dochte (dünner)
-            ax.plot([dates[i], dates[i]], 
-                    [highs[i], max(opens[i], closes[i])], 
-                    color=color, 
-                    linewidth=0.6)
-            ax.plot([dates[i], dates[i]], 
-                    [min(opens[i], closes[i]), lows[i]], 
-                    color=color, 
-                    linewidth=0.6)
+        # Zwei Collections statt drei Linien pro Kerze
+        body_lows = np.minimum(opens, closes)
+        body_highs = np.maximum(opens, closes)
+        colors = np.where(np.array(closes) >= np.array(opens), '#82ef82', '#ff4d4d')
+        
+        # Kerzenkörper (sehr dünn)
+        ax.vlines(dates, body_lows, body_highs,
+                  colors=colors,
+                  linewidth=1.0,
+                  capstyle='round')
+        
+        # Dochte (dünner): obere und untere in einer Collection
+        ax.vlines(dates + dates,
+                  np.concatenate((body_highs, lows)),
+                  np.concatenate((highs, body_lows)),
+                  colors=np.concatenate((colors, colors)),
+                  linewidth=0.6)
         
         # Zeichne Heikin-Ashi Linie (dünn)
         ax.plot(dates, ha_closes, 
@@ -526,13 +507,10 @@ def plot_historical_prices(ax):
         
         # Mittelpreis des ausgewählten Zeitraums berechnen
         cutoff_time = datetime.now() - time_delta
-        mid_prices = []
         
-        for data in historical_data:
-            timestamp, open_price, high, low, close = data
-            if timestamp >= cutoff_time:
-                mid_price = (high + low) / 2
-                mid_prices.append(mid_price)
+        # Daten sind zeitlich sortiert: Fensterstart per Binärsuche statt alle Kerzen zu prüfen
+        window_start = bisect_left(dates, cutoff_time)
+        mid_prices = [(data[2] + data[3]) / 2 for data in historical_data[window_start:]]
         
         # Durchschnittlichen Mittelpreis berechnen
         avg_mid_price = sum(mid_prices) / len(mid_prices) if mid_prices else 0
@@ -648,18 +626,24 @@ def get_fear_and_greed_index():
 
 # Function to update Fear and Greed Index display
 def update_fear_and_greed_display():
-    index, classification = get_fear_and_greed_index()
-    
-    if index is not None:
-        fg_color = "#ff4d4d" if index < 45 else "#ffb84d" if index < 60 else "#82ef82"
-        fear_greed_label.config(text=f"{index} {classification}", fg=fg_color)
-    else:
-        fear_greed_label.config(text="N/A", fg="grey")
+    def fetch_fear_and_greed():
+        index, classification = get_fear_and_greed_index()
+        
+        if index is not None:
+            fg_color = "#ff4d4d" if index < 45 else "#ffb84d" if index < 60 else "#82ef82"
+            ui_bus.post(fear_greed_label, 'text', f"{index} {classification}")
+            ui_bus.post(fear_greed_label, 'fg', fg_color)
+        else:
+            ui_bus.post(fear_greed_label, 'text', "N/A")
+            ui_bus.post(fear_greed_label, 'fg', "grey")
     
-    fear_greed_label.after(60000, update_fear_and_greed_display)  # Update every minute
+    fetch_async(fetch_fear_and_greed,
+                lambda result: fear_greed_label.after(60000, update_fear_and_greed_display))  # Update every minute
 	
 if __name__ == "__main__":
     root = tk.Tk()
+    # Worker-Threads posten Widget-Updates, angewendet wird einmal pro Frame im Tk-Thread
+    ui_bus.attach(root)
     root.overrideredirect(1)
     root.geometry("640x450")
     root.config(bg="#212121")
@@ -780,7 +764,8 @@ if __name__ == "__main__":
 def update_conversion_reverse(event=None):
     try:
         eur_amount = float(eur_entry.get())
-        btc_to_eur_rate = get_bitcoin_price_eur()
+        # Zuletzt geladenen Preis nutzen (vor dem ersten Preis 0), nie ein blockierender Request
+        btc_to_eur_rate = last_price
         btc_value = eur_amount / btc_to_eur_rate if btc_to_eur_rate else 0
         reverse_conversion_label.config(text=f"{btc_value:.6f} BTC")
     except ValueError:
@@ -816,7 +801,8 @@ def update_profit_periodically():
     """Aktualisiert regelmäßig nur die Prozent-Anzeige"""
     try:
         btc_amount = float(btc_entry.get())
-        btc_to_eur_rate = get_bitcoin_price_eur()
+        # Zuletzt geladenen Preis nutzen statt eines eigenen blockierenden Requests
+        btc_to_eur_rate = last_price or None
         
         if btc_to_eur_rate is not None:
             # EUR Wert bleibt unverändert
@@ -873,22 +859,22 @@ style = get_window_long(hwnd, -20)  # -20 ist GWL_EXSTYLE
 set_window_long(hwnd, -20, style | 0x00040000 | 0x00000040)  # WS_EX_APPWINDOW und WS_EX_TOOLWINDOW entfernen
 
 def update_high_low():
-    """Fetch historical prices and update the high and low labels."""
-    historical_prices = get_historical_prices()
+    """Fetch historical prices in the background and post the high and low labels to the UI bus."""
+    def fetch_high_low():
+        historical_prices = get_historical_prices()
+        if historical_prices:
+            prices = [price[1] for price in historical_prices]
+            highest_price = max(prices)
+            #lowest_price = min(prices)
+            
+            ui_bus.post(high_label, 'text', f"Top: {highest_price:.2f}€")
+            #ui_bus.post(low_label, 'text', f"Low: {lowest_price:.2f}€")
+        else:
+            ui_bus.post(high_label, 'text', "High: N/A")
+            #ui_bus.post(low_label, 'text', "Low: N/A")
 
-    if historical_prices:
-        prices = [price[1] for price in historical_prices]
-        highest_price = max(prices)
-        #lowest_price = min(prices)
-        
-        high_label.config(text=f"Top: {highest_price:.2f}€")
-        #low_label.config(text=f"Low: {lowest_price:.2f}€")
-    else:
-        high_label.config(text="High: N/A")
-        #low_label.config(text="Low: N/A")
-    
     # Schedule the next update in 60 seconds
-    root.after(60000, update_high_low)
+    fetch_async(fetch_high_low, lambda result: root.after(60000, update_high_low))
 
 # Initial call to display the first high/low values
 update_high_low()
@@ -913,11 +899,15 @@ def get_btc_usd_rate():
     except:
         return None
 
+# Zuletzt geladene Kurse; die Umrechner lesen nur diese statt pro Tastendruck zu fragen
+last_usd_eur_rate = None
+last_btc_usd_rate = None
+
 # Update-Funktionen
 def update_usd_eur_conversion(event=None):
     try:
         usd_amount = float(usd_entry.get())
-        rate = get_usd_eur_rate()
+        rate = last_usd_eur_rate
         usd_eur_label.config(text=f"{usd_amount * rate:.2f} EUR")
     except:
         usd_eur_label.config(text="Error")
@@ -925,7 +915,7 @@ def update_usd_eur_conversion(event=None):
 def update_eur_usd_conversion(event=None):
     try:
         eur_amount = float(eur_usd_entry.get())
-        rate = get_usd_eur_rate()
+        rate = last_usd_eur_rate
         eur_usd_label.config(text=f"{eur_amount / rate:.2f} USD")
     except:
         eur_usd_label.config(text="Error")
@@ -933,23 +923,27 @@ def update_eur_usd_conversion(event=None):
 def update_btc_usd_conversion(event=None):
     try:
         btc_amount = float(btc_usd_entry.get())
-        rate = get_btc_usd_rate()
+        rate = last_btc_usd_rate
         btc_usd_label.config(text=f"{btc_amount * rate:.2f} USD")
     except:
         btc_usd_label.config(text="Error")
 
 def update_rates():
-    # USD/EUR
-    usd_eur_rate = get_usd_eur_rate()
-    if usd_eur_rate:
-        current_rate_label.config(text=f"1 USD = {usd_eur_rate:.4f} €")
-    
-    # BTC/USD
-    btc_usd_rate = get_btc_usd_rate()
-    if btc_usd_rate:
-        btc_rate_label.config(text=f"1 BTC = {btc_usd_rate:.2f} $")
+    def fetch_rates():
+        global last_usd_eur_rate, last_btc_usd_rate
+        # USD/EUR
+        usd_eur_rate = get_usd_eur_rate()
+        if usd_eur_rate:
+            last_usd_eur_rate = usd_eur_rate
+            ui_bus.post(current_rate_label, 'text', f"1 USD = {usd_eur_rate:.4f} €")
+        
+        # BTC/USD
+        btc_usd_rate = get_btc_usd_rate()
+        if btc_usd_rate:
+            last_btc_usd_rate = btc_usd_rate
+            ui_bus.post(btc_rate_label, 'text', f"1 BTC = {btc_usd_rate:.2f} $")
     #Update every 10s
-    root.after(10000, update_rates)
+    fetch_async(fetch_rates, lambda result: root.after(10000, update_rates))
 
 # UI-Elemente (mit absoluten Koordinaten)
 # ---- USD/EUR Converter ----
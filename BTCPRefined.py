@@ -1,21 +1,43 @@
-import tkinter as tk
-from tkinter import simpledialog, Toplevel, Text, Checkbutton, IntVar
 import requests
-import winreg
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlsplit, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import os
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from datetime import datetime, timedelta
 import numpy as np
 import ctypes
-import matplotlib.dates as mdates
 import sys
 import threading
-import queue
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import math
 import random
+import json
+from collections import OrderedDict
+
+# Headless-Modus: nur die Daten-Pipeline mit lokaler HTTP/SSE-API, ohne Tk und matplotlib
+HEADLESS = '--headless' in sys.argv
+# --stats: im Fenster beim Beenden alle Messwerte ausgeben (headless stehen sie unter /stats)
+PRINT_STATS = '--stats' in sys.argv
+
+if not HEADLESS:
+    import tkinter as tk
+    from tkinter import simpledialog, Toplevel, Text, Checkbutton, IntVar
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    import matplotlib.dates as mdates
+
+# winreg gibt es nur unter Windows (Autostart); ohne bleibt die Option wirkungslos
+try:
+    import winreg
+except ImportError:
+    winreg = None
+
+# Optional: websocket-client für den Live-Stream (ohne Paket: REST-Polling)
+try:
+    import websocket
+except ImportError:
+    websocket = None
 
 # Dateien für Einstellungen
 WINDOW_POSITION_FILE = "window_position.txt"
@@ -24,6 +46,7 @@ THEME_COLOR_FILE = "theme_color.txt"
 NOTEBOOK_FILE = "notes.txt"
 AVG_PRICE_FILE = "avg_price.txt"
 OPTIONS_FILE = "options.txt"
+OHLC_CACHE_DIR = "ohlc_cache"
 
 # Define the path to this script for startup
 APP_NAME = "BTC Pracker"
@@ -48,19 +71,157 @@ TIME_RANGES = {
 }
 
 current_time_range = '12h'
+STREAMING = True
 last_price = 0.0
 last_price_eur = 0.0
 last_price_usd = 0.0
 
-# Queues für Thread-Kommunikation
-price_queue = queue.Queue()
-historical_queue = queue.Queue()
-fear_greed_queue = queue.Queue()
-fx_rate_queue = queue.Queue()
+# ====== UI DISPATCHER ======
+class UIDispatcher:
+    """Weckt den Tk-Loop nur wenn ein Worker etwas postet, höchstens einmal pro Frame"""
+    FRAME_TIME = 1 / 60
+    
+    def __init__(self):
+        self.root = None
+        self.handler = None
+        self.wake_event = None
+        self.lock = threading.Lock()
+        self.wake_pending = False
+        self.calls = []
+        self.last_dispatch = 0.0
+        self.start_time = time.time()
+        self.stats = {'messages': 0, 'wakeups': 0}
+    
+    def attach(self, root, handler):
+        """Verbindet den Dispatcher mit dem Tk-Loop und arbeitet bereits gepostete Nachrichten ab"""
+        self.root = root
+        self.handler = handler
+        root.bind('<<DispatchWake>>', self.on_wake)
+        with self.lock:
+            self.wake_pending = True
+        root.after_idle(self.dispatch)
+    
+    def attach_thread(self, handler):
+        """Headless: ein eigener Thread übernimmt die Rolle des Tk-Loops"""
+        self.handler = handler
+        self.wake_event = threading.Event()
+        with self.lock:
+            self.wake_pending = True
+        self.wake_event.set()
+        threading.Thread(target=self.run_thread, daemon=True).start()
+    
+    def run_thread(self):
+        while True:
+            self.wake_event.wait()
+            self.wake_event.clear()
+            wait = self.FRAME_TIME - (time.perf_counter() - self.last_dispatch)
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                self.dispatch()
+            except Exception:
+                pass
+    
+    def notify(self):
+        """Von beliebigen Threads aufrufbar; weitere Posts bis zum Dispatch lösen keinen Wake aus"""
+        with self.lock:
+            if self.wake_pending or self.handler is None:
+                return
+            self.wake_pending = True
+        if self.wake_event is not None:
+            self.wake_event.set()
+            return
+        try:
+            self.root.event_generate('<<DispatchWake>>', when='tail')
+        except Exception:
+            # Tk noch nicht/nicht mehr im Mainloop
+            with self.lock:
+                self.wake_pending = False
+    
+    def call_soon(self, func):
+        """Von beliebigen Threads: func läuft beim nächsten Dispatch im Tk-Thread"""
+        with self.lock:
+            self.calls.append(func)
+        self.notify()
+    
+    def on_wake(self, event=None):
+        # Frame-Pacing: mehrere Wakes innerhalb eines Frames ergeben einen Dispatch
+        wait = self.FRAME_TIME - (time.perf_counter() - self.last_dispatch)
+        if wait > 0:
+            self.root.after(int(wait * 1000) + 1, self.dispatch)
+        else:
+            self.dispatch()
+    
+    def dispatch(self):
+        with self.lock:
+            self.wake_pending = False
+            calls, self.calls = self.calls, []
+        self.last_dispatch = time.perf_counter()
+        self.stats['wakeups'] += 1
+        for func in calls:
+            func()
+        self.stats['messages'] += self.handler()
+    
+    def get_rates(self):
+        """Nachrichten und Wakeups pro Sekunde seit dem Start"""
+        elapsed = max(time.time() - self.start_time, 1e-9)
+        return {
+            'messages_per_second': self.stats['messages'] / elapsed,
+            'wakeups_per_second': self.stats['wakeups'] / elapsed
+        }
+
+ui_dispatcher = UIDispatcher()
+
+class Mailbox:
+    """Hält pro Nachrichtentyp nur den neuesten Wert; nicht abgeholte ältere Werte werden verworfen"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.slots = {}
+        self.seq = 0
+        self.stats = {'posted': 0, 'delivered': 0, 'dropped': 0}
+    
+    def put(self, item):
+        """Postet (msg_type, data) und weckt den Tk-Loop über den Dispatcher"""
+        msg_type, data = item
+        with self.lock:
+            self.seq += 1
+            if msg_type in self.slots:
+                self.stats['dropped'] += 1
+            self.slots[msg_type] = (self.seq, data)
+            self.stats['posted'] += 1
+        ui_dispatcher.notify()
+    
+    def drain(self):
+        """Gibt die aktuellen (msg_type, data)-Paare in Post-Reihenfolge zurück und leert die Mailbox"""
+        with self.lock:
+            slots = self.slots
+            self.slots = {}
+            self.stats['delivered'] += len(slots)
+        ordered = sorted(slots.items(), key=lambda item: item[1][0])
+        return [(msg_type, data) for msg_type, (seq, data) in ordered]
+
+# Mailboxen für Thread-Kommunikation (pro Datenstrom höchstens ein Update pro Frame)
+price_queue = Mailbox()
+historical_queue = Mailbox()
+fear_greed_queue = Mailbox()
+fx_rate_queue = Mailbox()
+MAILBOXES = {'price': price_queue, 'historical': historical_queue, 'fear_greed': fear_greed_queue, 'fx_rate': fx_rate_queue}
 
 # Thread Pool für API Calls
 executor = ThreadPoolExecutor(max_workers=4)
 
+# Startzeit für Time-to-first-Chart
+APP_START_TIME = time.perf_counter()
+startup_stats = {'first_chart_seconds': None, 'first_chart_source': None}
+
+def record_first_chart():
+    """Hält Time-to-first-Chart beim ersten Chart fest und gibt sie einmal aus (auch unter /stats)"""
+    if startup_stats['first_chart_seconds'] is not None:
+        return
+    startup_stats['first_chart_seconds'] = time.perf_counter() - APP_START_TIME
+    print(f"BTC Pracker: erster Chart nach {startup_stats['first_chart_seconds']:.2f} s"
+          f" ({startup_stats['first_chart_source']})")
+
 # ====== LOADING STATUS SYSTEM ======
 class LoadingStatus:
     def __init__(self):
@@ -72,17 +233,20 @@ class LoadingStatus:
         }
         self.callbacks = []
         self.all_loaded = False
+        self.lock = threading.Lock()
     
     def set_loaded(self, key):
-        """Markiert einen Daten-Typ als geladen"""
-        self.status[key] = True
-        
-        # Prüfe ob alle geladen sind
-        if all(self.status.values()) and not self.all_loaded:
+        """Markiert einen Daten-Typ als geladen (aus Worker-Threads)"""
+        with self.lock:
+            self.status[key] = True
+            # Prüfe ob alle geladen sind
+            if not all(self.status.values()) or self.all_loaded:
+                return
             self.all_loaded = True
-            # Benachrichtige alle Callbacks
-            for callback in self.callbacks:
-                callback()
+        
+        # Callbacks fassen Widgets an: über den Dispatcher im Tk-Thread ausführen
+        for callback in self.callbacks:
+            ui_dispatcher.call_soon(callback)
     
     def get_progress(self):
         """Gibt Fortschritt als Prozent zurück (0-100)"""
@@ -579,72 +743,1383 @@ class WelcomeScreen:
         if hasattr(self.parent, 'show_main_window'):
             self.parent.show_main_window()
 
-# ====== THREADED API FUNCTIONS ======
-def fetch_bitcoin_price_thread():
-    """Holt Bitcoin-Preis in der gewählten Währung"""
-    try:
-        if CURRENCY == "USD":
-            url = 'https://api.kraken.com/0/public/Ticker?pair=XBTUSD'
-            pair_key = 'XXBTZUSD'
-        else:
-            url = 'https://api.kraken.com/0/public/Ticker?pair=XBTEUR'
-            pair_key = 'XXBTZEUR'
+# ====== RATE LIMITER ======
+KRAKEN_HOST = 'api.kraken.com'
+FEAR_GREED_HOST = 'api.alternative.me'
+
+# (Tokens pro Sekunde, Burst) je Host; Kraken erlaubt öffentlich etwa einen Aufruf pro Sekunde
+HOST_RATE_LIMITS = {
+    KRAKEN_HOST: (1.0, 3),
+    FEAR_GREED_HOST: (0.2, 2)
+}
+RATE_LIMIT_BACKOFF_BASE = 5    # Sekunden nach dem ersten 429 / EAPI:Rate limit
+RATE_LIMIT_BACKOFF_MAX = 300
+
+class RateLimiter:
+    """Token-Bucket pro Host mit adaptivem Backoff, sobald der Server ein Rate-Limit meldet"""
+    def __init__(self, limits, default=(1.0, 2)):
+        self.limits = limits
+        self.default = default
+        self.lock = threading.Lock()
+        self.buckets = {}
+    
+    def get_bucket(self, host):
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            rate, capacity = self.limits.get(host, self.default)
+            bucket = {
+                'rate': rate, 'capacity': capacity, 'tokens': float(capacity), 'updated': time.monotonic(),
+                'blocked_until': 0.0, 'strikes': 0, 'granted': 0, 'deferred': 0, 'rate_limited': 0
+            }
+            self.buckets[host] = bucket
+        return bucket
+    
+    def get_wait(self, bucket, needed=1):
+        """Füllt den Bucket auf; gibt 0 zurück oder die Sekunden, bis needed Tokens frei sind"""
+        now = time.monotonic()
+        bucket['tokens'] = min(bucket['capacity'], bucket['tokens'] + (now - bucket['updated']) * bucket['rate'])
+        bucket['updated'] = now
+        if now < bucket['blocked_until']:
+            return bucket['blocked_until'] - now
+        if bucket['tokens'] >= needed:
+            return 0.0
+        return (needed - bucket['tokens']) / bucket['rate']
+    
+    def peek(self, host, reserved=0):
+        """Wie try_acquire, nimmt aber kein Token; reserved zählt bereits zugelassene Jobs mit"""
+        with self.lock:
+            return self.get_wait(self.get_bucket(host), reserved + 1)
+    
+    def try_acquire(self, host):
+        """Nimmt ein Token; gibt 0 zurück oder die Sekunden, bis wieder eines frei ist"""
+        with self.lock:
+            bucket = self.get_bucket(host)
+            wait = self.get_wait(bucket)
+            if wait > 0:
+                bucket['deferred'] += 1
+                return wait
+            bucket['tokens'] -= 1
+            bucket['granted'] += 1
+            return 0.0
+    
+    def acquire(self, host, timeout):
+        """Wartet bis zu timeout Sekunden auf ein Token; gibt die Wartezeit oder None zurück.
+        Hosts ohne eigenes Limit (z.B. lokale Testserver) werden nicht gebremst."""
+        if host not in self.limits:
+            return 0.0
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(host)
+            if wait <= 0:
+                return waited
+            if waited + wait > timeout:
+                return None
+            time.sleep(wait)
+            waited += wait
+    
+    def report(self, host, limited):
+        """Antwort eines Hosts: Rate-Limit verdoppelt die Sperrzeit (mit Jitter), Erfolg setzt sie zurück"""
+        with self.lock:
+            bucket = self.get_bucket(host)
+            if not limited:
+                bucket['strikes'] = 0
+                return
+            bucket['strikes'] += 1
+            bucket['rate_limited'] += 1
+            backoff = min(RATE_LIMIT_BACKOFF_MAX, RATE_LIMIT_BACKOFF_BASE * 2 ** (bucket['strikes'] - 1))
+            bucket['blocked_until'] = time.monotonic() + backoff * random.uniform(1.0, 1.25)
+            bucket['tokens'] = 0.0
+    
+    def rate_limited_count(self, host):
+        with self.lock:
+            return self.get_bucket(host)['rate_limited']
+    
+    def get_stats(self):
+        with self.lock:
+            now = time.monotonic()
+            return {
+                host: {
+                    'granted': bucket['granted'],
+                    'deferred': bucket['deferred'],
+                    'rate_limited': bucket['rate_limited'],
+                    'blocked_for': max(0.0, bucket['blocked_until'] - now)
+                }
+                for host, bucket in self.buckets.items()
+            }
+
+rate_limiter = RateLimiter(HOST_RATE_LIMITS)
+
+# ====== HTTP CLIENT ======
+class HttpClient:
+    """Gemeinsamer HTTP-Client mit Keep-Alive und Connection-Pool pro Host"""
+    def __init__(self, pool_size=4):
+        # Ein Adapter für alle Threads: urllib3 hält darin einen Pool pro Host
+        self.adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.stats = {}
+    
+    def get_session(self):
+        """Session pro Thread (Cookies/Header), Verbindungen kommen aus dem gemeinsamen Pool"""
+        session = getattr(self.local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.mount('https://', self.adapter)
+            session.mount('http://', self.adapter)
+            self.local.session = session
+        return session
+    
+    def get(self, url, timeout=5):
+        """GET über eine wiederverwendete Verbindung mit Zeitmessung pro Request.
+        Jeder Request nimmt ein Token des Hosts, auch mehrere innerhalb eines Scheduler-Jobs."""
+        host = urlsplit(url).netloc
+        waited = rate_limiter.acquire(host, timeout)
+        if waited is None:
+            self.record(host, 0.0, True)
+            raise requests.exceptions.RetryError(f"Rate-Limit für {host}: kein Token innerhalb von {timeout}s")
+        with self.lock:
+            self.stats.setdefault(host, self.new_entry())['rate_wait'] += waited
+        start = time.perf_counter()
+        failed = False
+        try:
+            response = self.get_session().get(url, timeout=timeout)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self.record(host, time.perf_counter() - start, failed)
+        # Kraken meldet Rate-Limits meist als HTTP 200 mit Fehler im JSON
+        limited = response.status_code == 429 or b'EAPI:Rate limit' in response.content[:512]
+        rate_limiter.report(host, limited)
+        return response
+    
+    def new_entry(self):
+        return {'requests': 0, 'errors': 0, 'total_time': 0.0, 'max_time': 0.0, 'last_time': 0.0, 'rate_wait': 0.0}
+    
+    def record(self, host, elapsed, failed):
+        with self.lock:
+            entry = self.stats.setdefault(host, self.new_entry())
+            entry['requests'] += 1
+            entry['errors'] += 1 if failed else 0
+            entry['total_time'] += elapsed
+            entry['max_time'] = max(entry['max_time'], elapsed)
+            entry['last_time'] = elapsed
+    
+    def get_stats(self):
+        """Gibt Request-Anzahl und mittlere Dauer pro Host zurück"""
+        with self.lock:
+            return {
+                host: dict(entry, avg_time=entry['total_time'] / entry['requests'])
+                for host, entry in self.stats.items() if entry['requests'] > 0
+            }
+    
+    def warm_up(self, url):
+        """Baut TCP+TLS vorab auf, damit der erste echte Request die Verbindung wiederverwendet"""
+        try:
+            self.get(url, timeout=5).content
+        except Exception:
+            pass
+
+http_client = HttpClient()
+
+# ====== SINGLE-FLIGHT ======
+class SingleFlight:
+    """Bündelt gleichzeitige identische Abfragen zu einem einzigen Request"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = {}
+        self.stats = {'executed': 0, 'coalesced': 0}
+    
+    def do(self, key, func):
+        """Führt func einmal pro Key aus; gibt (Ergebnis, geteilt) zurück"""
+        with self.lock:
+            call = self.in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = {'done': threading.Event(), 'result': None, 'error': None}
+                self.in_flight[key] = call
+                self.stats['executed'] += 1
+            else:
+                self.stats['coalesced'] += 1
         
-        response = requests.get(url, timeout=5)
+        if not leader:
+            call['done'].wait()
+            if call['error'] is not None:
+                raise call['error']
+            return call['result'], True
+        
+        try:
+            call['result'] = func()
+        except Exception as e:
+            call['error'] = e
+            raise
+        finally:
+            with self.lock:
+                del self.in_flight[key]
+            call['done'].set()
+        return call['result'], False
+
+single_flight = SingleFlight()
+
+# ====== JOB SCHEDULER ======
+# Kleinere Zahl = wichtiger; bei knappen Tokens läuft der Preis vor FX, OHLC und Fear & Greed
+PRIORITY_PRICE = 0
+PRIORITY_FX = 1
+PRIORITY_OHLC = 2
+PRIORITY_FEAR_GREED = 3
+PRIORITY_PREFETCH = 4
+PRIORITY_LOCAL = 5  # Jobs ohne Host (kein Token), z.B. die Sichtbarkeitsprüfung
+SCHEDULER_JITTER = 0.1  # ±10 % auf jedes Intervall, damit Jobs nicht im Gleichschritt feuern
+
+class JobScheduler:
+    """Ein Thread für alle wiederkehrenden Abfragen: Prioritäten, Zulassung nach freien Tokens pro Host,
+    Jitter und Statistik pro Job"""
+    def __init__(self, limiter):
+        self.limiter = limiter
+        self.cond = threading.Condition()
+        self.jobs = {}
+        self.scale = 1.0
+        self.running = False
+    
+    def add(self, name, func, interval, priority, host, when=None, delay=0.0, base_interval=None, scaled=True):
+        """Registriert einen Job; interval darf eine Funktion sein, when() False überspringt einen Lauf.
+        base_interval ist der feste Vergleichstakt für adaptive Intervalle, host=None braucht kein Token,
+        scaled=False nimmt den Job von set_scale aus."""
+        with self.cond:
+            self.jobs[name] = {
+                'func': func, 'interval': interval, 'base_interval': base_interval, 'priority': priority,
+                'host': host, 'when': when, 'next_run': time.monotonic() + delay, 'last_ran': None,
+                'busy': False, 'forced': False, 'scaled': scaled,
+                'stats': {'runs': 0, 'skipped': 0, 'deferred': 0, 'rate_limited': 0, 'fixed_equivalent': 0.0,
+                          'total_time': 0.0, 'max_time': 0.0, 'last_time': 0.0}
+            }
+            self.cond.notify()
+    
+    def submit(self, name, func, priority, host):
+        """Einmaliger Job mit gleicher Priorisierung und Token-Vergabe (läuft pro Name höchstens einmal gleichzeitig)"""
+        with self.cond:
+            if name in self.jobs:
+                return
+        self.add(name, func, None, priority, host)
+    
+    def run_now(self, name):
+        """Zieht einen Job vor, auch wenn when() ihn gerade überspringen würde"""
+        with self.cond:
+            job = self.jobs.get(name)
+            if job is not None:
+                job['next_run'] = time.monotonic()
+                job['forced'] = True
+                self.cond.notify()
+    
+    def start(self):
+        with self.cond:
+            if self.running:
+                return
+            self.running = True
+        threading.Thread(target=self.run, daemon=True).start()
+    
+    def stop(self):
+        with self.cond:
+            self.running = False
+            self.cond.notify()
+    
+    def set_scale(self, scale):
+        """Streckt alle wiederkehrenden Intervalle (z.B. bei verstecktem Fenster); kürzere Takte greifen sofort"""
+        with self.cond:
+            previous, self.scale = self.scale, scale
+            if scale < previous:
+                now = time.monotonic()
+                for job in self.jobs.values():
+                    if job['interval'] is not None and job['scaled'] and not job['busy']:
+                        job['next_run'] = min(job['next_run'], now + self.get_interval(job) * scale)
+            self.cond.notify()
+    
+    def get_interval(self, job, key='interval'):
+        interval = job[key]
+        return interval() if callable(interval) else interval
+    
+    def reschedule(self, name, job, base_time, ran=False):
+        if job['interval'] is None:
+            del self.jobs[name]
+            return
+        interval = self.get_interval(job)
+        if ran:
+            # Wie viele Läufe der feste Takt seit dem letzten Lauf gebraucht hätte
+            base_interval = self.get_interval(job, 'base_interval') or interval
+            since = 1.0 if job['last_ran'] is None else (base_time - job['last_ran']) / base_interval
+            job['stats']['fixed_equivalent'] += since
+            job['last_ran'] = base_time
+        jitter = random.uniform(1 - SCHEDULER_JITTER, 1 + SCHEDULER_JITTER)
+        job['next_run'] = base_time + interval * (self.scale if job['scaled'] else 1.0) * jitter
+    
+    def run(self):
+        with self.cond:
+            while self.running:
+                now = time.monotonic()
+                due = [(job['priority'], name) for name, job in self.jobs.items()
+                       if not job['busy'] and job['next_run'] <= now]
+                reserved = {}
+                for priority, name in sorted(due):
+                    job = self.jobs[name]
+                    if job['when'] is not None and not job['forced'] and not job['when']():
+                        job['stats']['skipped'] += 1
+                        # Übersprungene Zeit hätte auch der feste Takt nicht abgefragt
+                        job['last_ran'] = None
+                        self.reschedule(name, job, now)
+                        continue
+                    # Nur Zulassung nach Priorität; das Token nimmt jeder HTTP-Request selbst
+                    if job['host'] is None:
+                        wait = 0.0
+                    else:
+                        wait = self.limiter.peek(job['host'], reserved.get(job['host'], 0))
+                    if wait > 0:
+                        job['stats']['deferred'] += 1
+                        job['next_run'] = now + wait
+                        continue
+                    reserved[job['host']] = reserved.get(job['host'], 0) + 1
+                    job['busy'] = True
+                    job['forced'] = False
+                    executor.submit(self.execute, name, job)
+                
+                pending = [job['next_run'] for job in self.jobs.values() if not job['busy']]
+                self.cond.wait(max(0.0, min(pending) - time.monotonic()) if pending else None)
+    
+    def execute(self, name, job):
+        host = job['host']
+        limited_before = self.limiter.rate_limited_count(host) if host is not None else 0
+        start = time.perf_counter()
+        try:
+            job['func']()
+        except Exception:
+            pass
+        elapsed = time.perf_counter() - start
+        limited = host is not None and self.limiter.rate_limited_count(host) > limited_before
+        
+        with self.cond:
+            stats = job['stats']
+            stats['runs'] += 1
+            stats['rate_limited'] += 1 if limited else 0
+            stats['total_time'] += elapsed
+            stats['max_time'] = max(stats['max_time'], elapsed)
+            stats['last_time'] = elapsed
+            job['busy'] = False
+            if self.jobs.get(name) is job:
+                self.reschedule(name, job, time.monotonic(), ran=True)
+            self.cond.notify()
+    
+    def get_stats(self):
+        """Läufe, übersprungene/verzögerte Läufe, Rate-Limits und Laufzeiten pro Job"""
+        with self.cond:
+            now = time.monotonic()
+            return {
+                name: dict(job['stats'],
+                           avg_time=job['stats']['total_time'] / job['stats']['runs'] if job['stats']['runs'] else 0.0,
+                           interval=self.get_interval(job),
+                           next_in=max(0.0, job['next_run'] - now))
+                for name, job in self.jobs.items()
+            }
+
+job_scheduler = JobScheduler(rate_limiter)
+
+# ====== ADAPTIVE CADENCE ======
+VOLATILITY_REFERENCE = 0.0005  # typische BTC-Volatilität pro Minute (Std.-Abw. der Log-Renditen)
+VOLATILITY_WINDOW = 30         # so viele letzte Kerzen fließen in die realisierte Volatilität ein
+
+# (kürzestes, längstes) Intervall in Sekunden pro Job
+CADENCE_BOUNDS = {
+    'price': (3, 30),
+    'ohlc': (5, 120)
+}
+
+class CadenceController:
+    """Skaliert die Poll-Intervalle mit der realisierten Volatilität der letzten Kerzen"""
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.lock = threading.Lock()
+        self.volatility = None
+        self.factor = 1.0
+    
+    def observe(self, candles, interval_minutes):
+        """Neue Kerzen: Volatilität pro Minute aus den Log-Renditen der Schlusskurse"""
+        closes = candles.closes[-(VOLATILITY_WINDOW + 1):]
+        if len(closes) < 3 or np.any(closes <= 0):
+            return
+        volatility = float(np.diff(np.log(closes)).std()) / math.sqrt(interval_minutes)
+        with self.lock:
+            self.volatility = volatility
+            # Doppelte Volatilität halbiert das Intervall; die Grenzen fangen Extremwerte ab
+            self.factor = VOLATILITY_REFERENCE / volatility if volatility > 0 else math.inf
+    
+    def interval(self, name, base):
+        low, high = self.bounds[name]
+        with self.lock:
+            factor = self.factor
+        return min(high, max(low, base * factor))
+    
+    def get_report(self, job_stats):
+        """Requests der adaptiven Jobs im Vergleich zum festen Zeitplan"""
+        report = {'volatility': self.volatility, 'factor': self.factor, 'jobs': {}}
+        for name in self.bounds:
+            stats = job_stats.get(name)
+            if stats is None:
+                continue
+            fixed = stats['fixed_equivalent']
+            report['jobs'][name] = {
+                'requests': stats['runs'],
+                'fixed_schedule_requests': fixed,
+                'saved': fixed - stats['runs'],
+                'saved_percent': (fixed - stats['runs']) / fixed * 100 if fixed else 0.0
+            }
+        return report
+
+cadence_controller = CadenceController(CADENCE_BOUNDS)
+
+# ====== CANDLE STORE ======
+def get_local_offsets(times):
+    """UTC-Offset in Sekunden pro Zeitstempel (Sommerzeit!); einmal pro Stunde berechnet, nicht pro Kerze"""
+    hours, inverse = np.unique(np.asarray(times) // 3600, return_inverse=True)
+    offsets = np.array([time.localtime(int(hour) * 3600).tm_gmtoff for hour in hours], dtype=np.int64)
+    return offsets[inverse]
+
+class CandleStore:
+    """Kerzen als zusammenhängende Spalten: int64 Epoch-Sekunden und float64 OHLCV"""
+    def __init__(self, times=None, values=None):
+        if times is None:
+            times = np.empty(0, dtype=np.int64)
+            values = np.empty((5, 0), dtype=np.float64)
+        # Zeilen von value_buffer: open, high, low, close, volume
+        self.time_buffer = np.ascontiguousarray(times, dtype=np.int64)
+        self.value_buffer = np.ascontiguousarray(values, dtype=np.float64).reshape(5, -1)
+        self.size = len(self.time_buffer)
+    
+    @classmethod
+    def from_kraken(cls, rows):
+        """Parst Krakens OHLC-Zeilen [time, open, high, low, close, vwap, volume, count] direkt in Arrays"""
+        try:
+            times = np.array([row[0] for row in rows], dtype=np.int64)
+            values = np.array([(row[1], row[2], row[3], row[4], row[6]) for row in rows], dtype=np.float64)
+        except (ValueError, IndexError, TypeError):
+            # Langsamer Weg: fehlerhafte Zeilen einzeln überspringen
+            parsed = []
+            for row in rows:
+                try:
+                    parsed.append((int(row[0]), float(row[1]), float(row[2]),
+                                   float(row[3]), float(row[4]), float(row[6])))
+                except (ValueError, IndexError, TypeError):
+                    continue
+            array = np.array(parsed, dtype=np.float64).reshape(-1, 6)
+            times = array[:, 0].astype(np.int64)
+            values = array[:, 1:]
+        return cls(times, values.reshape(-1, 5).T)
+    
+    @classmethod
+    def from_array(cls, array):
+        """Erzeugt den Store aus einem (n, 6)-Array: Epoch, Open, High, Low, Close, Volume"""
+        array = np.asarray(array, dtype=np.float64)
+        values = np.zeros((5, len(array)), dtype=np.float64)
+        values[:array.shape[1] - 1] = array[:, 1:].T
+        return cls(array[:, 0].astype(np.int64), values)
+    
+    def to_array(self):
+        return np.column_stack((self.times.astype(np.float64), self.value_buffer[:, :self.size].T))
+    
+    def __len__(self):
+        return self.size
+    
+    # Views auf die Puffer, keine Kopien
+    @property
+    def times(self):
+        return self.time_buffer[:self.size]
+    
+    @property
+    def opens(self):
+        return self.value_buffer[0, :self.size]
+    
+    @property
+    def highs(self):
+        return self.value_buffer[1, :self.size]
+    
+    @property
+    def lows(self):
+        return self.value_buffer[2, :self.size]
+    
+    @property
+    def closes(self):
+        return self.value_buffer[3, :self.size]
+    
+    @property
+    def volumes(self):
+        return self.value_buffer[4, :self.size]
+    
+    @property
+    def nbytes(self):
+        return self.time_buffer.nbytes + self.value_buffer.nbytes
+    
+    def dates(self):
+        """Zeitachse für Matplotlib in lokaler Zeit"""
+        return mdates.date2num((self.times + get_local_offsets(self.times)).astype('datetime64[s]'))
+    
+    def copy(self):
+        """Unabhängiger Snapshot für die Übergabe an andere Threads"""
+        return CandleStore(self.times.copy(), self.value_buffer[:, :self.size].copy())
+    
+    def slice_from(self, start_time):
+        """Kerzen ab start_time (Epoch) als Views, ohne Kopie"""
+        first = int(np.searchsorted(self.times, start_time))
+        return CandleStore(self.times[first:], self.value_buffer[:, first:self.size])
+    
+    def slice_until(self, end_time):
+        """Kerzen vor end_time (Epoch) als Views, ohne Kopie"""
+        last = int(np.searchsorted(self.times, end_time))
+        return CandleStore(self.times[:last], self.value_buffer[:, :last])
+    
+    def prepend(self, older):
+        """Neue Serie aus älteren Kerzen (z.B. gröberes Intervall) gefolgt von dieser"""
+        if not len(older):
+            return self
+        return CandleStore(np.concatenate((older.times, self.times)),
+                           np.concatenate((older.value_buffer[:, :len(older)], self.value_buffer[:, :self.size]), axis=1))
+    
+    def resample(self, interval, offset=0):
+        """Aggregiert zu interval-Minuten-Kerzen; offset (Sekunden) legt die Bucket-Grenzen fest"""
+        if not self.size:
+            return CandleStore()
+        step = interval * 60
+        buckets = (self.times - offset) // step
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        ends = np.r_[starts[1:], self.size] - 1
+        values = np.empty((5, len(starts)), dtype=np.float64)
+        values[0] = self.opens[starts]
+        values[1] = np.maximum.reduceat(self.highs, starts)
+        values[2] = np.minimum.reduceat(self.lows, starts)
+        values[3] = self.closes[ends]
+        values[4] = np.add.reduceat(self.volumes, starts)
+        return CandleStore(buckets[starts] * step + offset, values)
+    
+    def reserve(self, size):
+        """Vergrößert die Puffer amortisiert, damit Anhängen nicht jedes Mal kopiert"""
+        if size <= len(self.time_buffer):
+            return
+        capacity = max(size, 2 * len(self.time_buffer), 16)
+        times = np.empty(capacity, dtype=np.int64)
+        values = np.empty((5, capacity), dtype=np.float64)
+        times[:self.size] = self.times
+        values[:, :self.size] = self.value_buffer[:, :self.size]
+        self.time_buffer = times
+        self.value_buffer = values
+    
+    def merge(self, other, max_gap=None, max_size=None):
+        """Ersetzt Kerzen ab der ersten neuen Zeit (offene Kerze) und hängt neue an.
+        max_gap=None hängt auch über Lücken hinweg an, ohne den Bestand zu verwerfen."""
+        if not len(other):
+            return
+        
+        first_time = other.times[0]
+        # Lücke zum Bestand (z.B. nach langem Standby): komplette Serie ersetzen
+        if self.size == 0 or (max_gap is not None and first_time - self.times[-1] > max_gap):
+            keep = 0
+        else:
+            keep = int(np.searchsorted(self.times, first_time))
+        
+        total = keep + len(other)
+        self.reserve(total)
+        self.time_buffer[keep:total] = other.times
+        self.value_buffer[:, keep:total] = other.value_buffer[:, :len(other)]
+        self.size = total
+        
+        if max_size is not None and total > max_size:
+            drop = total - max_size
+            self.time_buffer[:max_size] = self.time_buffer[drop:total]
+            self.value_buffer[:, :max_size] = self.value_buffer[:, drop:total]
+            self.size = max_size
+
+# ====== HEIKIN-ASHI ======
+# HA-Open-Rekursion ha_open[i] = (ha_open[i-1] + ha_close[i-1]) / 2 als Faltung mit 1/2, 1/4, ...
+# (nach 60 Schritten liegt das Gewicht unter der float64-Genauigkeit)
+HA_OPEN_WEIGHTS = np.concatenate(([0.0], 0.5 ** np.arange(1, 61)))
+
+def heikin_ashi_arrays(opens, highs, lows, closes):
+    """Berechnet die komplette Heikin-Ashi-Serie vektorisiert"""
+    ha_closes = (opens + highs + lows + closes) / 4
+    ha_opens = np.convolve(ha_closes, HA_OPEN_WEIGHTS)[:len(ha_closes)]
+    ha_opens += opens[0] * 0.5 ** np.arange(len(ha_closes))
+    ha_highs = np.maximum(highs, np.maximum(ha_opens, ha_closes))
+    ha_lows = np.minimum(lows, np.minimum(ha_opens, ha_closes))
+    return ha_opens, ha_highs, ha_lows, ha_closes
+
+class HeikinAshiEngine:
+    """Hält die HA-Serie zu einem CandleStore; neue oder revidierte Kerzen kosten O(1)"""
+    def __init__(self):
+        self.series = CandleStore()
+        self.stats = {'full': 0, 'incremental': 0}
+    
+    def update(self, candles):
+        """Gibt die HA-Serie (time, open, high, low, close) passend zu candles zurück"""
+        n = len(candles)
+        m = len(self.series)
+        if n >= 2 and m >= 2:
+            times = candles.times
+            ha_times = self.series.times
+            if n == m and times[0] == ha_times[0] and times[-1] == ha_times[-1]:
+                # Nur die offene Kerze hat sich geändert
+                self.revise_last(candles, n - 1)
+                self.stats['incremental'] += 1
+                return self.series
+            if times[-2] == ha_times[-1] and ((n == m + 1 and times[0] == ha_times[0])
+                                              or (n == m and times[0] == ha_times[1])):
+                # Vorherige Kerze geschlossen, eine neue angefangen
+                self.revise_last(candles, n - 2)
+                self.append(candles, n - 1)
+                self.stats['incremental'] += 1
+                return self.series
+        
+        self.recompute(candles)
+        return self.series
+    
+    def recompute(self, candles):
+        if not len(candles):
+            self.series = CandleStore()
+            return
+        ha_opens, ha_highs, ha_lows, ha_closes = heikin_ashi_arrays(
+            candles.opens, candles.highs, candles.lows, candles.closes)
+        self.series = CandleStore(candles.times.copy(),
+                                  np.vstack((ha_opens, ha_highs, ha_lows, ha_closes, candles.volumes)))
+        self.stats['full'] += 1
+    
+    def revise_last(self, candles, i):
+        """Aktualisiert die letzte HA-Kerze mit den Werten von candles[i]; HA-Open bleibt"""
+        ha_close = (candles.opens[i] + candles.highs[i] + candles.lows[i] + candles.closes[i]) / 4
+        values = self.series.value_buffer
+        j = len(self.series) - 1
+        values[1, j] = max(candles.highs[i], values[0, j], ha_close)
+        values[2, j] = min(candles.lows[i], values[0, j], ha_close)
+        values[3, j] = ha_close
+        values[4, j] = candles.volumes[i]
+    
+    def append(self, candles, i):
+        """Hängt candles[i] an; HA-Open aus der vorherigen HA-Kerze"""
+        ha_open = (self.series.opens[-1] + self.series.closes[-1]) / 2
+        ha_close = (candles.opens[i] + candles.highs[i] + candles.lows[i] + candles.closes[i]) / 4
+        row = CandleStore(
+            candles.times[i:i + 1].copy(),
+            np.array([ha_open,
+                      max(candles.highs[i], ha_open, ha_close),
+                      min(candles.lows[i], ha_open, ha_close),
+                      ha_close,
+                      candles.volumes[i]])
+        )
+        self.series.merge(row, max_gap=float('inf'), max_size=len(candles))
+
+# ====== WINDOW STATISTICS ======
+class WindowStats:
+    """Index über sortierte Zeitstempel: Fenster per Binärsuche, Mittelwert über Präfixsummen, Min/Max über Sparse Table"""
+    def __init__(self, times, values):
+        self.times = times
+        self.values = np.array(values, dtype=np.float64)
+        self.prefix = np.concatenate(([0.0], np.cumsum(self.values)))
+        
+        # Ebene k enthält Min/Max über [i, i + 2^k)
+        self.min_table = [self.values]
+        self.max_table = [self.values]
+        width = 1
+        while width * 2 <= len(self.values):
+            self.min_table.append(np.minimum(self.min_table[-1][:-width], self.min_table[-1][width:]))
+            self.max_table.append(np.maximum(self.max_table[-1][:-width], self.max_table[-1][width:]))
+            width *= 2
+    
+    def matches(self, times):
+        """True wenn der Index zur gleichen Kerzenbasis gehört (nur der letzte Wert darf abweichen)"""
+        return (len(times) == len(self.times) and len(times) > 0
+                and times[0] == self.times[0] and times[-1] == self.times[-1])
+    
+    def update_last(self, value):
+        """Ersetzt den letzten Wert (offene Kerze) in O(log n)"""
+        n = len(self.values)
+        self.values[-1] = value
+        self.prefix[-1] = self.prefix[-2] + value
+        for level in range(1, len(self.min_table)):
+            # Nur Intervalle, die den letzten Index enthalten
+            width = 1 << level
+            i = n - width
+            half = width // 2
+            self.min_table[level][i] = min(self.min_table[level - 1][i], self.min_table[level - 1][i + half])
+            self.max_table[level][i] = max(self.max_table[level - 1][i], self.max_table[level - 1][i + half])
+    
+    def window(self, start_time, end_time=None):
+        """Indexbereich [lo, hi) der Werte mit start_time <= t (< end_time)"""
+        lo = int(np.searchsorted(self.times, start_time, side='left'))
+        hi = len(self.times) if end_time is None else int(np.searchsorted(self.times, end_time, side='left'))
+        return lo, hi
+    
+    def mean(self, start_time, end_time=None):
+        lo, hi = self.window(start_time, end_time)
+        if hi <= lo:
+            return None
+        return float((self.prefix[hi] - self.prefix[lo]) / (hi - lo))
+    
+    def range_query(self, table, combine, start_time, end_time):
+        lo, hi = self.window(start_time, end_time)
+        if hi <= lo:
+            return None
+        level = (hi - lo).bit_length() - 1
+        return float(combine(table[level][lo], table[level][hi - (1 << level)]))
+    
+    def min(self, start_time, end_time=None):
+        return self.range_query(self.min_table, min, start_time, end_time)
+    
+    def max(self, start_time, end_time=None):
+        return self.range_query(self.max_table, max, start_time, end_time)
+    
+    def quantile(self, q, start_time, end_time=None):
+        lo, hi = self.window(start_time, end_time)
+        if hi <= lo:
+            return None
+        return float(np.quantile(self.values[lo:hi], q))
+
+mid_price_stats = None
+
+def get_mid_price_stats(historical_data):
+    """WindowStats über (High+Low)/2; bei gleicher Kerzenbasis wird nur die offene Kerze nachgeführt"""
+    global mid_price_stats
+    times = historical_data.times
+    last_mid = (historical_data.highs[-1] + historical_data.lows[-1]) / 2
+    if mid_price_stats is not None and mid_price_stats.matches(times):
+        if mid_price_stats.values[-1] != last_mid:
+            mid_price_stats.update_last(last_mid)
+    else:
+        mid_price_stats = WindowStats(times.copy(), (historical_data.highs + historical_data.lows) / 2)
+    return mid_price_stats
+
+# ====== CANDLE SYNC ======
+OHLC_MAX_CANDLES = 720  # Kraken liefert maximal 720 Kerzen pro OHLC-Abfrage
+
+class CandleSync:
+    """Hält die OHLC-Kerzen eines (Pair, Intervall) und synchronisiert inkrementell über Krakens `last`-Cursor"""
+    def __init__(self, pair, pair_key, interval):
+        self.pair = pair
+        self.pair_key = pair_key
+        self.interval = interval
+        self.candles = CandleStore()
+        self.last = None
+        self.synced_at = None
+        self.lock = threading.Lock()
+        self.stats = {'full_syncs': 0, 'incremental_syncs': 0, 'rows_parsed': 0, 'bytes_received': 0}
+    
+    def build_url(self):
+        """Nach dem ersten Laden wird nur noch ab dem `last`-Cursor abgefragt"""
+        url = f'https://api.kraken.com/0/public/OHLC?pair={self.pair}&interval={self.interval}'
+        if self.last is not None:
+            url += f'&since={self.last}'
+        return url
+    
+    def sync(self):
+        """Holt neue Kerzen, mergt sie und gibt einen Snapshot der Serie zurück"""
+        with self.lock:
+            incremental = self.last is not None
+            url = self.build_url()
+        
+        # Request ohne Lock, damit Stream-Updates nicht auf das Netzwerk warten
+        response = http_client.get(url, timeout=10)
         response.raise_for_status()
         data = response.json()
         
-        if 'result' in data and pair_key in data['result']:
-            price = float(data['result'][pair_key]['c'][0])
-            price_queue.put(('bitcoin_price', price))
-        else:
-            price_queue.put(('bitcoin_price', None))
-    except Exception as e:
-        price_queue.put(('bitcoin_price', None))
-    finally:
-        loading_status.set_loaded('bitcoin_price')
+        if 'result' not in data or self.pair_key not in data['result']:
+            return CandleStore()
+        
+        rows = CandleStore.from_kraken(data['result'][self.pair_key])
+        
+        with self.lock:
+            self.merge(rows)
+            self.last = data['result'].get('last', self.last)
+            
+            self.stats['incremental_syncs' if incremental else 'full_syncs'] += 1
+            self.stats['rows_parsed'] += len(rows)
+            self.stats['bytes_received'] += len(response.content)
+            self.synced_at = time.monotonic()
+            candles = self.candles.copy()
+        
+        save_candle_cache(self.pair, self.interval, candles)
+        ohlc_cache.trim()
+        return candles
+    
+    def load_cache(self):
+        """Übernimmt die Kerzen aus dem Disk-Cache, der Cursor setzt an der letzten geschlossenen Kerze an"""
+        with self.lock:
+            if not len(self.candles):
+                self.candles = load_candle_cache(self.pair, self.interval)
+                if len(self.candles) >= 2:
+                    self.last = int(self.candles.times[-2])
+            return self.candles.copy()
+    
+    def merge(self, rows):
+        """Ersetzt die noch offene Kerze und hängt neue Kerzen an"""
+        self.candles.merge(rows, max_gap=self.interval * 60, max_size=OHLC_MAX_CANDLES)
+
+def candle_cache_path(pair, interval):
+    return os.path.join(OHLC_CACHE_DIR, f"{pair}_{interval}.npy")
+
+def save_candle_cache(pair, interval, candles):
+    """Schreibt die Kerzen atomar als (n, 6) float64-Array: Epoch, Open, High, Low, Close, Volume"""
+    if not len(candles):
+        return
+    try:
+        os.makedirs(OHLC_CACHE_DIR, exist_ok=True)
+        path = candle_cache_path(pair, interval)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, candles.to_array())
+        os.replace(tmp_path, path)
+    except Exception:
+        pass
 
-def fetch_historical_prices_thread():
-    """Holt historische Preise in einem separaten Thread"""
+def load_candle_cache(pair, interval):
+    """Lädt die zuletzt gespeicherten Kerzen für (Pair, Intervall)"""
+    path = candle_cache_path(pair, interval)
+    if not os.path.exists(path):
+        return CandleStore()
     try:
-        time_range = TIME_RANGES[current_time_range]
-        interval = time_range['interval']
+        return CandleStore.from_array(np.load(path))
+    except Exception:
+        return CandleStore()
+
+# ====== OHLC CACHE ======
+OHLC_CACHE_MAX_BYTES = 8 * 1024 * 1024
+# Sekunden pro Intervall, bis eine Serie wieder vom Netzwerk abgeglichen wird
+OHLC_CACHE_TTL = {1: 5, 60: 60, 240: 240, 1440: 900, 10080: 3600}
+
+class OhlcCache:
+    """LRU über die CandleSync-Instanzen pro (Pair, Intervall) mit TTL und Speicherobergrenze"""
+    def __init__(self, max_bytes=OHLC_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+    
+    def get(self, pair, pair_key, interval):
+        """Gibt die CandleSync zurück; eine neue Instanz startet mit dem Disk-Cache"""
+        key = (pair, interval)
+        with self.lock:
+            candle_sync = self.entries.get(key)
+            if candle_sync is not None:
+                self.entries.move_to_end(key)
+                self.stats['hits'] += 1
+                return candle_sync
+            self.stats['misses'] += 1
+            candle_sync = CandleSync(pair, pair_key, interval)
+            self.entries[key] = candle_sync
+        candle_sync.load_cache()
+        self.trim()
+        return candle_sync
+    
+    def trim(self):
+        """Verdrängt die am längsten ungenutzten Serien, bis der Speicher unter der Grenze liegt"""
+        with self.lock:
+            total = sum(entry.candles.nbytes for entry in self.entries.values())
+            while total > self.max_bytes and len(self.entries) > 1:
+                key, evicted = self.entries.popitem(last=False)
+                total -= evicted.candles.nbytes
+                self.stats['evictions'] += 1
+    
+    def is_fresh(self, candle_sync):
+        """Innerhalb der TTL wird die Serie ohne Request aus dem Speicher bedient"""
+        synced_at = candle_sync.synced_at
+        ttl = OHLC_CACHE_TTL.get(candle_sync.interval, 60)
+        return synced_at is not None and time.monotonic() - synced_at < ttl
+    
+    def get_stats(self):
+        with self.lock:
+            return dict(self.stats, entries=len(self.entries),
+                        bytes=sum(entry.candles.nbytes for entry in self.entries.values()))
+
+ohlc_cache = OhlcCache()
+
+def get_ohlc_pair():
+    """Gibt (Pair, Result-Key) der gewählten Währung für die OHLC-API zurück"""
+    if CURRENCY == "USD":
+        return 'XBTUSD', 'XXBTZUSD'
+    return 'XBTEUR', 'XXBTZEUR'
+
+def get_candle_sync(pair, pair_key, interval):
+    """Gibt die CandleSync-Instanz für (Pair, Intervall) aus dem LRU-Cache zurück"""
+    return ohlc_cache.get(pair, pair_key, interval)
+
+# ====== CANDLE PYRAMID ======
+CANDLE_BASE_INTERVAL = 1  # Minuten; daraus werden alle gröberen Intervalle lokal abgeleitet
+PYRAMID_INTERVALS = sorted({CANDLE_BASE_INTERVAL} | {time_range['interval'] for time_range in TIME_RANGES.values()})
+
+def get_range_start(range_name, interval):
+    """Frühester Zeitpunkt (Epoch), den der Zeitraum braucht; None für 'ALL' (so weit wie vorhanden)"""
+    time_range = TIME_RANGES[range_name]
+    now = time.time()
+    if 'hours' in time_range:
+        start = now - time_range['hours'] * 3600
+    elif 'days' in time_range:
+        start = now - time_range['days'] * 86400
+    elif 'start_of_year' in time_range:
+        start = datetime(datetime.now().year, 1, 1).timestamp()
+    else:
+        return None
+    # Kraken liefert höchstens 720 Kerzen, mehr Historie kann auch kein geladenes Intervall haben
+    return max(start, now - (OHLC_MAX_CANDLES - 1) * interval * 60)
+
+class CandlePyramid:
+    """Pro Pair eine 1-Minuten-Basisserie; gröbere Intervalle werden aus dem Speicher bedient und ihr
+    jüngster Teil lokal aus der Basis aggregiert. Nur zu tiefe Historie kommt aus dem Netzwerk."""
+    def __init__(self, pair, pair_key):
+        self.pair = pair
+        self.pair_key = pair_key
+        self.stats = {'local': 0, 'network': 0, 'base_syncs': 0, 'level_refreshes': 0}
+    
+    @property
+    def base(self):
+        # Jedes Mal aus dem Cache, damit nach einer Verdrängung keine zweite Instanz weiterlebt
+        return get_candle_sync(self.pair, self.pair_key, CANDLE_BASE_INTERVAL)
+    
+    def current_level(self, interval, memo=None):
+        """Intervall aus dem Speicher, die offene(n) Kerze(n) aus dem nächstfeineren aktuellen Intervall
+        aggregiert (z.B. 1440 aus 240 aus 60 aus 1); None wenn keine Kette die Lücke überbrückt"""
+        memo = {} if memo is None else memo
+        if interval in memo:
+            return memo[interval]
+        
+        level = get_candle_sync(self.pair, self.pair_key, interval)
+        with level.lock:
+            candles = level.candles.copy()
+        if interval == CANDLE_BASE_INTERVAL or not len(candles):
+            memo[interval] = candles if len(candles) else None
+            return memo[interval]
+        
+        result = None
+        last_start = int(candles.times[-1])
+        step = interval * 60
+        for finer in reversed([i for i in PYRAMID_INTERVALS if i < interval]):
+            source = self.current_level(finer, memo)
+            # Die Quelle muss ab der letzten (offenen) Kerze des Levels lückenlos vorliegen
+            if source is not None and source.times[0] <= last_start:
+                tail = source.slice_from(last_start).resample(interval, offset=last_start % step)
+                with level.lock:
+                    level.merge(tail)
+                    result = level.candles.copy()
+                break
+        memo[interval] = result
+        return result
+    
+    def view(self, range_name):
+        """Serie für den Zeitraum ohne Netzwerk; None wenn die Historie nicht im Speicher ist"""
+        interval = TIME_RANGES[range_name]['interval']
+        start = get_range_start(range_name, interval)
+        memo = {}
+        candles = self.current_level(interval, memo)
+        if candles is not None and (start is None or candles.times[0] <= start + interval * 60):
+            return candles
+        
+        # Reicht die Basis für den ganzen Zeitraum, wird komplett lokal aggregiert
+        base = self.current_level(CANDLE_BASE_INTERVAL, memo)
+        if start is not None and base is not None and base.times[0] <= start:
+            return base.resample(interval)
+        return None
+    
+    def get(self, range_name):
+        """Veraltete Basis abgleichen, dann aus dem Speicher bedienen; sonst das Intervall laden"""
+        base = self.base
+        if not ohlc_cache.is_fresh(base):
+            try:
+                single_flight.do(('OHLC', self.pair, CANDLE_BASE_INTERVAL), base.sync)
+                self.stats['base_syncs'] += 1
+            except Exception:
+                # Ohne Netzwerk bleibt der Stand im Speicher gültig
+                pass
         
-        if CURRENCY == "USD":
-            pair = 'XBTUSD'
-            pair_key = 'XXBTZUSD'
-        else:
-            pair = 'XBTEUR'
-            pair_key = 'XXBTZEUR'
+        interval = TIME_RANGES[range_name]['interval']
+        level = get_candle_sync(self.pair, self.pair_key, interval)
+        candles = self.view(range_name)
+        if candles is not None and (level is base or ohlc_cache.is_fresh(level)):
+            self.stats['local'] += 1
+            return candles
         
-        url = f'https://api.kraken.com/0/public/OHLC?pair={pair}&interval={interval}'
+        # Nicht im Speicher, oder lokal fortgeschriebene Serie nach Ablauf der TTL mit Kraken abgleichen
+        self.stats['network' if candles is None else 'level_refreshes'] += 1
+        try:
+            single_flight.do(('OHLC', self.pair, interval), level.sync)
+        except Exception:
+            if candles is not None:
+                return candles
+            raise
+        candles = self.view(range_name)
+        if candles is None:
+            with level.lock:
+                candles = level.candles.copy()
+        return candles
+
+def load_older_candles(pair, pair_key, interval, before, until):
+    """Historie vor den geladenen Kerzen (until) bis mindestens before (Epoch). Kraken liefert pro Intervall
+    nur die letzten 720 Kerzen, ältere Zeiten gibt es daher nur aus dem nächstgröberen Intervall."""
+    result = CandleStore()
+    for coarser in (i for i in PYRAMID_INTERVALS if i > interval):
+        level = get_candle_sync(pair, pair_key, coarser)
+        if not len(level.candles):
+            single_flight.do(('OHLC', pair, coarser), level.sync)
+        # Kerzen, die vor der bisher ältesten beginnen (die letzte darf überlappen, sonst bliebe
+        # je nach Ausrichtung der Intervalle eine Lücke); jedes gröbere Intervall setzt davor an
+        with level.lock:
+            candles = level.candles.slice_until(until).copy()
+        if len(candles):
+            result = result.prepend(candles)
+            until = int(candles.times[0])
+        if until <= before:
+            break
+    return result
+
+candle_pyramids = {}
+candle_pyramids_lock = threading.Lock()
+
+def get_candle_pyramid(pair, pair_key):
+    """Gibt die CandlePyramid für ein Pair zurück"""
+    with candle_pyramids_lock:
+        if pair not in candle_pyramids:
+            candle_pyramids[pair] = CandlePyramid(pair, pair_key)
+        return candle_pyramids[pair]
+
+# ====== FX RATE SERVICE ======
+FX_FALLBACK_RATE = 0.92
+FX_RATE_TTL = 60  # Sekunden, danach gilt der Kurs als veraltet
+
+class FxRateService:
+    """USD/EUR-Kurs im Speicher: Ticker und Stream halten ihn aktuell, Leser blockieren nie"""
+    def __init__(self, ttl=FX_RATE_TTL):
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.rate = None
+        self.updated_at = 0.0
+        self.refreshing = False
+        self.stats = {'reads': 0, 'stale_reads': 0, 'updates': 0, 'refreshes': 0}
+    
+    def update(self, rate):
+        """Neuer Kurs aus Ticker-Batch oder Stream"""
+        if not rate:
+            return
+        with self.lock:
+            self.rate = rate
+            self.updated_at = time.monotonic()
+            self.stats['updates'] += 1
+    
+    def get(self):
+        """Gibt (Kurs, veraltet) sofort zurück; ein veralteter Kurs stößt eine Hintergrund-Aktualisierung an"""
+        with self.lock:
+            self.stats['reads'] += 1
+            stale = self.rate is None or time.monotonic() - self.updated_at > self.ttl
+            rate = self.rate if self.rate is not None else FX_FALLBACK_RATE
+            start_refresh = stale and not self.refreshing
+            if stale:
+                self.stats['stale_reads'] += 1
+            if start_refresh:
+                self.refreshing = True
+        
+        # Stale-while-revalidate: alter Wert jetzt, frischer Wert beim nächsten Lesen
+        if start_refresh:
+            job_scheduler.submit('fx_refresh', self.refresh, PRIORITY_FX, KRAKEN_HOST)
+        return rate, stale
+    
+    def refresh(self):
+        """Holt den Kurs im Worker-Thread; gleichzeitige Anfragen teilen sich einen Request"""
+        try:
+            self.stats['refreshes'] += 1
+            rate, _ = single_flight.do(('Ticker', 'USDTEUR'), fetch_usd_eur_rate)
+            self.update(rate)
+            if rate:
+                fx_rate_queue.put(('fx_rate', rate))
+        except Exception:
+            pass
+        finally:
+            with self.lock:
+                self.refreshing = False
+
+def fetch_usd_eur_rate():
+    """Wechselkurs per REST (nur im Worker-Thread aufrufen)"""
+    url = 'https://api.kraken.com/0/public/Ticker?pair=USDTEUR'
+    response = http_client.get(url, timeout=5)
+    data = response.json()
+    return float(data['result']['USDTEUR']['c'][0])
+
+fx_rate_service = FxRateService()
+
+# ====== WEBSOCKET STREAM ======
+KRAKEN_WS_URL = os.environ.get('KRAKEN_WS_URL', 'wss://ws.kraken.com')
+STREAM_PAIRS = {'XBT/EUR': 'XXBTZEUR', 'XBT/USD': 'XXBTZUSD', 'USDT/EUR': 'USDTEUR'}
+STREAM_STALE_AFTER = 15  # Sekunden ohne Nachricht (Kraken sendet ~1s Heartbeats)
+STREAM_CHART_INTERVAL = 1.0  # Sekunden zwischen zwei Chart-Updates aus dem Kerzen-Kanal
+
+class KrakenStream:
+    """Streamt Ticker und OHLC über Krakens WebSocket in price_queue/historical_queue"""
+    def __init__(self, url=KRAKEN_WS_URL):
+        self.url = url
+        self.running = False
+        self.connected = False
+        self.thread = None
+        self.ws = None
+        self.subscription = None
+        self.last_message_time = 0.0
+        self.last_historical_post = 0.0
+        self.post_lock = threading.Lock()
+        self.post_timer = None
+        self.pending_tick = None
+        self.stats = {
+            'connects': 0, 'reconnects': 0, 'messages': 0, 'ticks': 0, 'candles': 0, 'resyncs': 0,
+            'latency_count': 0, 'latency_total': 0.0, 'latency_max': 0.0
+        }
+    
+    def start(self):
+        """Startet den Stream-Thread (nur wenn websocket-client installiert ist)"""
+        if websocket is None or self.running:
+            return False
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        return True
+    
+    def stop(self):
+        self.running = False
+        ws = self.ws
+        if ws is not None:
+            try:
+                ws.close()
+            except Exception:
+                pass
+    
+    def is_healthy(self):
+        """True solange der Stream verbunden ist und Nachrichten liefert"""
+        return self.connected and time.time() - self.last_message_time < STREAM_STALE_AFTER
+    
+    def current_subscription(self):
+        # Immer die Basis-Kerzen: jeder Zeitraum wird daraus abgeleitet, ein Wechsel braucht kein neues Abo
+        pair = 'XBT/USD' if CURRENCY == "USD" else 'XBT/EUR'
+        return pair, CANDLE_BASE_INTERVAL
+    
+    def run(self):
+        """Verbindet, hört zu und verbindet mit exponentiellem Backoff neu"""
+        backoff = 1.0
+        while self.running:
+            connected_at = time.time()
+            try:
+                self.connect()
+                self.listen()
+            except Exception:
+                pass
+            finally:
+                self.connected = False
+                if self.ws is not None:
+                    try:
+                        self.ws.close()
+                    except Exception:
+                        pass
+                    self.ws = None
+            
+            if not self.running:
+                break
+            
+            # Nur nach stabiler Verbindung wieder schnell neu verbinden
+            if time.time() - connected_at > 60:
+                backoff = 1.0
+            self.stats['reconnects'] += 1
+            time.sleep(backoff + random.uniform(0, backoff / 2))
+            backoff = min(backoff * 2, 60.0)
+    
+    def connect(self):
+        self.ws = websocket.create_connection(self.url, timeout=5)
+        self.subscription = self.current_subscription()
+        pair, interval = self.subscription
+        self.ws.send(json.dumps({
+            'event': 'subscribe',
+            'pair': list(STREAM_PAIRS.keys()),
+            'subscription': {'name': 'ticker'}
+        }))
+        self.ws.send(json.dumps({
+            'event': 'subscribe',
+            'pair': [pair],
+            'subscription': {'name': 'ohlc', 'interval': interval}
+        }))
+        self.connected = True
+        self.last_message_time = time.time()
+        self.stats['connects'] += 1
+    
+    def listen(self):
+        while self.running:
+            # Währung oder Zeitraum geändert: mit neuem Abo neu verbinden
+            if self.current_subscription() != self.subscription:
+                return
+            try:
+                raw = self.ws.recv()
+            except websocket.WebSocketTimeoutException:
+                if time.time() - self.last_message_time > STREAM_STALE_AFTER:
+                    return
+                continue
+            if not raw:
+                return
+            self.handle_message(json.loads(raw))
+    
+    def handle_message(self, message):
+        self.last_message_time = time.time()
+        self.stats['messages'] += 1
+        
+        # Heartbeats und Status-Events sind Dicts, Daten kommen als Listen
+        if not isinstance(message, list) or len(message) < 4:
+            return
+        payload, channel, pair = message[1], message[2], message[3]
+        if channel == 'ticker':
+            self.handle_ticker(pair, payload)
+        elif channel.startswith('ohlc'):
+            self.handle_candle(pair, payload)
+    
+    def handle_ticker(self, pair, payload):
+        pair_key = STREAM_PAIRS.get(pair)
+        try:
+            price = float(payload['c'][0])
+        except (KeyError, IndexError, ValueError, TypeError):
+            return
+        
+        self.stats['ticks'] += 1
+        if pair_key == 'USDTEUR':
+            fx_rate_service.update(price)
+            fx_rate_queue.put(('fx_rate', price))
+        elif pair_key == ('XXBTZUSD' if CURRENCY == "USD" else 'XXBTZEUR'):
+            self.pending_tick = time.perf_counter()
+            price_queue.put(('bitcoin_price', price))
+        elif pair_key is not None:
+            price_queue.put(('opposite_price', price))
+    
+    def handle_candle(self, pair, payload):
+        pair_name, interval = self.subscription
+        if pair != pair_name:
+            return
+        try:
+            # Kraken liefert das Ende der Kerze (etime), die Serie ist nach Startzeit sortiert
+            start_time = int(float(payload[1])) - interval * 60
+            row = CandleStore(
+                np.array([start_time], dtype=np.int64),
+                np.array([float(payload[2]), float(payload[3]), float(payload[4]),
+                          float(payload[5]), float(payload[7])], dtype=np.float64)
+            )
+        except (IndexError, ValueError, TypeError):
+            return
         
-        response = requests.get(url, timeout=10)
+        self.stats['candles'] += 1
+        pair = pair_name.replace('/', '')
+        candle_sync = get_candle_sync(pair, STREAM_PAIRS[pair_name], interval)
+        with candle_sync.lock:
+            # Erst nach dem REST-Snapshot mergen, sonst bestünde die Serie aus einer Kerze
+            if not len(candle_sync.candles):
+                return
+            last_start = int(candle_sync.candles.times[-1])
+            # Verspätete Kerze: würde die jüngeren abschneiden
+            if start_time < last_start:
+                return
+            # Nur das Ende ersetzen bzw. anhängen; der Kanal sendet nur bei Trades, fehlende Minuten
+            # (oder ein Reconnect) dürfen die Historie nicht verwerfen
+            gap = start_time - last_start > interval * 60
+            candle_sync.candles.merge(row, max_size=OHLC_MAX_CANDLES)
+        
+        if gap:
+            # Lücke per REST ab dem `last`-Cursor auffüllen
+            self.stats['resyncs'] += 1
+            job_scheduler.submit(f'resync {pair} {interval}',
+                                 lambda: single_flight.do(('OHLC', pair, interval), candle_sync.sync),
+                                 PRIORITY_OHLC, KRAKEN_HOST)
+        
+        # Höchstens ein Chart-Update pro Sekunde, Trades kommen deutlich öfter; was im Sperrfenster
+        # ankommt, wird an dessen Ende nachgereicht (latest-wins wie die Mailbox)
+        with self.post_lock:
+            if self.post_timer is not None:
+                return
+            wait = self.last_historical_post + STREAM_CHART_INTERVAL - time.time()
+            if wait > 0:
+                self.post_timer = threading.Timer(wait, self.post_historical, (pair, STREAM_PAIRS[pair_name]))
+                self.post_timer.daemon = True
+                self.post_timer.start()
+                return
+        self.post_historical(pair, STREAM_PAIRS[pair_name])
+    
+    def post_historical(self, pair, pair_key):
+        """Postet den gewählten Zeitraum mit dem beim Aufruf neuesten Stand der Basis-Kerzen"""
+        with self.post_lock:
+            self.post_timer = None
+            self.last_historical_post = time.time()
+        # Gewählten Zeitraum aus der Pyramide: nur die jüngste Kerze wird neu aggregiert
+        historical_data = get_candle_pyramid(pair, pair_key).view(current_time_range)
+        if historical_data is not None:
+            cadence_controller.observe(historical_data, TIME_RANGES[current_time_range]['interval'])
+            historical_queue.put(('historical_data', historical_data))
+    
+    def record_display(self):
+        """Misst die Zeit vom empfangenen Tick bis zum aktualisierten Label"""
+        if self.pending_tick is None:
+            return
+        latency = time.perf_counter() - self.pending_tick
+        self.pending_tick = None
+        self.stats['latency_count'] += 1
+        self.stats['latency_total'] += latency
+        self.stats['latency_max'] = max(self.stats['latency_max'], latency)
+
+kraken_stream = KrakenStream()
+
+# ====== THREADED API FUNCTIONS ======
+def fetch_ticker_batch_thread():
+    """Holt BTC/EUR, BTC/USD und USD/EUR mit einem einzigen Ticker-Request"""
+    prices = {}
+    try:
+        url = 'https://api.kraken.com/0/public/Ticker?pair=XBTEUR,XBTUSD,USDTEUR'
+        response = http_client.get(url, timeout=5)
         response.raise_for_status()
         data = response.json()
         
-        if 'result' in data and pair_key in data['result']:
-            prices = data['result'][pair_key]
-            historical_data = []
-            
-            for price in prices:
-                try:
-                    historical_data.append((
-                        datetime.fromtimestamp(int(price[0])),
-                        float(price[1]),
-                        float(price[2]),
-                        float(price[3]),
-                        float(price[4])
-                    ))
-                except (ValueError, IndexError):
-                    continue
-            
-            historical_queue.put(('historical_data', historical_data))
+        for pair_key, ticker in data.get('result', {}).items():
+            try:
+                prices[pair_key] = float(ticker['c'][0])
+            except (KeyError, IndexError, ValueError):
+                continue
+    except Exception as e:
+        pass
+    
+    try:
+        if CURRENCY == "USD":
+            price = prices.get('XXBTZUSD')
+            opposite_price = prices.get('XXBTZEUR')
         else:
-            historical_queue.put(('historical_data', []))
+            price = prices.get('XXBTZEUR')
+            opposite_price = prices.get('XXBTZUSD')
+        usd_eur_rate = prices.get('USDTEUR')
+        
+        # Fehlende Werte nicht posten, sonst verdrängen sie einen gültigen Stream-Preis
+        if price is not None:
+            price_queue.put(('bitcoin_price', price))
+        fx_rate_service.update(usd_eur_rate)
+        fx_rate_queue.put(('fx_rate', usd_eur_rate if usd_eur_rate else fx_rate_service.get()[0]))
+        
+        # Fallback: gegenteiligen Preis über den Wechselkurs berechnen
+        if opposite_price is None and price and usd_eur_rate:
+            opposite_price = price * usd_eur_rate if CURRENCY == "USD" else price / usd_eur_rate
+        if opposite_price is not None:
+            price_queue.put(('opposite_price', opposite_price))
+    finally:
+        loading_status.set_loaded('bitcoin_price')
+        loading_status.set_loaded('fx_rate')
+
+def fetch_historical_prices_thread():
+    """Holt historische Preise in einem separaten Thread"""
+    try:
+        range_name = current_time_range
+        interval = TIME_RANGES[range_name]['interval']
+        pair, pair_key = get_ohlc_pair()
+        
+        # Aus der Kerzen-Pyramide; überlappende Timer teilen sich einen Abgleich und ein Ergebnis
+        pyramid = get_candle_pyramid(pair, pair_key)
+        historical_data, shared = single_flight.do(('Range', pair, range_name), lambda: pyramid.get(range_name))
+        # Inzwischen gewechselter Zeitraum: altes Ergebnis nicht mehr zeichnen
+        if not shared and range_name == current_time_range:
+            cadence_controller.observe(historical_data, interval)
+            historical_queue.put(('historical_data', historical_data))
             
     except Exception as e:
-        historical_queue.put(('historical_data', []))
+        historical_queue.put(('historical_data', CandleStore()))
     finally:
         loading_status.set_loaded('historical_data')
 
@@ -652,7 +2127,7 @@ def fetch_fear_greed_thread():
     """Holt Fear & Greed Index in einem separaten Thread"""
     try:
         url = 'https://api.alternative.me/fng/?limit=1'
-        response = requests.get(url, timeout=5)
+        response = http_client.get(url, timeout=5)
         response.raise_for_status()
         data = response.json()
         
@@ -667,74 +2142,106 @@ def fetch_fear_greed_thread():
     finally:
         loading_status.set_loaded('fear_greed')
 
-def fetch_fx_rate_thread():
-    """Holt Wechselkurs in einem separaten Thread"""
-    try:
-        # Immer USD/EUR Wechselkurs holen
-        url = 'https://api.kraken.com/0/public/Ticker?pair=USDTEUR'
-        response = requests.get(url, timeout=5)
-        data = response.json()
-        
-        if 'result' in data and 'USDTEUR' in data['result']:
-            rate = float(data['result']['USDTEUR']['c'][0])
-            fx_rate_queue.put(('fx_rate', rate))
-        else:
-            fx_rate_queue.put(('fx_rate', 0.92))
-    except Exception as e:
-        fx_rate_queue.put(('fx_rate', 0.92))
-    finally:
-        loading_status.set_loaded('fx_rate')
-
-def fetch_opposite_currency_price():
-    """Holt den Preis in der gegenteiligen Währung direkt von der API"""
-    try:
-        if CURRENCY == "USD":
-            # Wenn USD ausgewählt, hole EUR Preis
-            url = 'https://api.kraken.com/0/public/Ticker?pair=XBTEUR'
-            pair_key = 'XXBTZEUR'
-        else:
-            # Wenn EUR ausgewählt, hole USD Preis
-            url = 'https://api.kraken.com/0/public/Ticker?pair=XBTUSD'
-            pair_key = 'XXBTZUSD'
-        
-        response = requests.get(url, timeout=5)
-        response.raise_for_status()
-        data = response.json()
-        
-        if 'result' in data and pair_key in data['result']:
-            opposite_price = float(data['result'][pair_key]['c'][0])
-            
-            # Update das btc_rate_label mit dem direkten API-Preis
-            if CURRENCY == "USD":
-                btc_rate_label.config(text=f"1 BTC = {opposite_price:.2f} €")
-            else:
-                btc_rate_label.config(text=f"1 BTC = {opposite_price:.2f} $")
-        else:
-            # Fallback auf Wechselkurs-Berechnung
-            update_btc_rate_with_fx()
-    except Exception as e:
-        # Fallback auf Wechselkurs-Berechnung
-        update_btc_rate_with_fx()
-
-def update_btc_rate_with_fx():
-    """Fallback: Berechnet gegenteiligen Preis mit Wechselkurs"""
-    try:
-        # Hole Wechselkurs
-        url = 'https://api.kraken.com/0/public/Ticker?pair=USDTEUR'
-        response = requests.get(url, timeout=5)
-        data = response.json()
-        
-        if 'result' in data and 'USDTEUR' in data['result']:
-            usd_eur_rate = float(data['result']['USDTEUR']['c'][0])
-            
-            if CURRENCY == "USD" and last_price > 0:
-                btc_in_eur = last_price * usd_eur_rate
-                btc_rate_label.config(text=f"1 BTC = {btc_in_eur:.2f} €")
-            elif CURRENCY == "EUR" and last_price > 0:
-                btc_in_usd = last_price / usd_eur_rate
-                btc_rate_label.config(text=f"1 BTC = {btc_in_usd:.2f} $")
-    except:
-        pass
+def get_ohlc_base_interval():
+    # Mit Stream kommen die Kerzen live, dann reicht ein Abgleich pro Minute
+    return 60 if kraken_stream.is_healthy() else 10
+
+def schedule_polling_jobs():
+    """Registriert alle wiederkehrenden Abfragen beim zentralen Scheduler und startet ihn"""
+    # REST-Preis (inkl. Wechselkurs) nur als Fallback, solange der WebSocket-Stream nicht liefert
+    job_scheduler.add('price', fetch_ticker_batch_thread, lambda: cadence_controller.interval('price', 10),
+                      PRIORITY_PRICE, KRAKEN_HOST, when=lambda: not kraken_stream.is_healthy(),
+                      delay=0.1, base_interval=10)
+    job_scheduler.add('ohlc', fetch_historical_prices_thread,
+                      lambda: cadence_controller.interval('ohlc', get_ohlc_base_interval()),
+                      PRIORITY_OHLC, KRAKEN_HOST, delay=0.2, base_interval=get_ohlc_base_interval)
+    job_scheduler.add('fear_greed', fetch_fear_greed_thread, 60, PRIORITY_FEAR_GREED, FEAR_GREED_HOST, delay=0.3)
+    job_scheduler.start()
+
+def prefetch_time_ranges():
+    """Lädt alle Zeiträume mit niedrigster Priorität vor, damit ein Wechsel sofort aus dem Cache zeichnet"""
+    pair, pair_key = get_ohlc_pair()
+    pyramid = get_candle_pyramid(pair, pair_key)
+    for range_name in TIME_RANGES:
+        job_scheduler.submit(f'prefetch {pair} {range_name}', lambda name=range_name: pyramid.get(name),
+                             PRIORITY_PREFETCH, KRAKEN_HOST)
+
+# ====== SETTINGS STORE ======
+class SettingsStore:
+    """Einstellungsdateien im Speicher; Schreibzugriffe werden gesammelt und verzögert atomar gespeichert"""
+    def __init__(self, flush_delay=1.0):
+        self.flush_delay = flush_delay
+        self.lock = threading.Lock()
+        self.cache = {}
+        self.dirty = set()
+        self.timer = None
+        self.stats = {'disk_reads': 0, 'reads': 0, 'writes': 0, 'flushes': 0, 'files_written': 0, 'flush_errors': 0}
+    
+    def read(self, path):
+        """Dateiinhalt aus dem Speicher; die Datei wird nur beim ersten Zugriff gelesen (None = fehlt)"""
+        with self.lock:
+            self.stats['reads'] += 1
+            if path not in self.cache:
+                self.stats['disk_reads'] += 1
+                try:
+                    with open(path, "r") as f:
+                        self.cache[path] = f.read()
+                except OSError:
+                    self.cache[path] = None
+            return self.cache[path]
+    
+    def write(self, path, text):
+        """Aktualisiert den Speicher sofort und plant einen gemeinsamen Flush"""
+        text = str(text)
+        with self.lock:
+            if self.cache.get(path) == text and path not in self.dirty:
+                return
+            self.cache[path] = text
+            self.dirty.add(path)
+            self.stats['writes'] += 1
+            # Debounce: jeder Schreibzugriff schiebt den Flush um flush_delay hinaus
+            self.schedule()
+    
+    def schedule(self):
+        """(Re-)armiert den Flush-Timer; nur mit gehaltenem Lock aufrufen"""
+        if self.timer is not None:
+            self.timer.cancel()
+        self.timer = threading.Timer(self.flush_delay, self.flush)
+        self.timer.daemon = True
+        self.timer.start()
+    
+    def flush(self):
+        """Schreibt alle geänderten Dateien (tmp + os.replace, damit nie halbe Dateien entstehen)"""
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            pending = {path: self.cache[path] for path in self.dirty}
+            self.dirty.clear()
+            if pending:
+                self.stats['flushes'] += 1
+        
+        failed = []
+        for path, text in pending.items():
+            tmp_path = f"{path}.tmp"
+            try:
+                with open(tmp_path, "w") as f:
+                    f.write(text)
+                os.replace(tmp_path, path)
+                with self.lock:
+                    self.stats['files_written'] += 1
+            except Exception:
+                failed.append(path)
+        
+        if failed:
+            # Wieder als geändert markieren und erneut planen, sonst gingen die Werte verloren
+            with self.lock:
+                self.stats['flush_errors'] += len(failed)
+                self.dirty.update(failed)
+                if self.timer is None:
+                    self.schedule()
+
+settings_store = SettingsStore()
 
 # ====== OPTIONS FILE HANDLING ======
 def save_options_to_file():
@@ -743,26 +2250,25 @@ def save_options_to_file():
         'currency': CURRENCY,
         'theme_color': theme_color,
         'time_range': current_time_range,
+        'streaming': 1 if STREAMING else 0,
         'startup': 1 if is_startup_enabled() else 0,
         'avg_price': load_avg_price(),
         'btc_amount': load_btc_value()
     }
     
-    with open(OPTIONS_FILE, "w") as f:
-        for key, value in options.items():
-            f.write(f"{key}={value}\n")
+    settings_store.write(OPTIONS_FILE, "".join(f"{key}={value}\n" for key, value in options.items()))
 
 def load_options_from_file():
     """Lädt alle Einstellungen aus einer Datei"""
-    global CURRENCY, theme_color, current_time_range
+    global CURRENCY, theme_color, current_time_range, STREAMING
     
-    if os.path.exists(OPTIONS_FILE):
+    text = settings_store.read(OPTIONS_FILE)
+    if text is not None:
         options = {}
-        with open(OPTIONS_FILE, "r") as f:
-            for line in f:
-                if '=' in line:
-                    key, value = line.strip().split('=', 1)
-                    options[key] = value
+        for line in text.splitlines():
+            if '=' in line:
+                key, value = line.strip().split('=', 1)
+                options[key] = value
         
         # Währung setzen
         if 'currency' in options:
@@ -776,6 +2282,10 @@ def load_options_from_file():
         if 'time_range' in options:
             current_time_range = options['time_range']
         
+        # Live-Stream setzen
+        if 'streaming' in options:
+            STREAMING = options['streaming'] == '1'
+        
         # Startup setzen
         if 'startup' in options:
             set_startup(int(options['startup']) == 1)
@@ -833,33 +2343,31 @@ def is_startup_enabled():
 
 # ====== WINDOW POSITION ======
 def load_window_position():
-    if os.path.exists(WINDOW_POSITION_FILE):
-        with open(WINDOW_POSITION_FILE, "r") as f:
-            try:
-                x, y = map(int, f.read().strip().split(','))
-                return x, y
-            except:
-                return None, None
+    text = settings_store.read(WINDOW_POSITION_FILE)
+    if text is not None:
+        try:
+            x, y = map(int, text.strip().split(','))
+            return x, y
+        except:
+            return None, None
     return None, None
 
 def save_window_position(x, y):
-    with open(WINDOW_POSITION_FILE, "w") as f:
-        f.write(f"{x},{y}")
+    settings_store.write(WINDOW_POSITION_FILE, f"{x},{y}")
 
 # ====== AVG PRICE FUNCTIONS ======
 def save_avg_price(price):
-    """Speichere den AVG Price in einer Datei."""
-    with open(AVG_PRICE_FILE, "w") as f:
-        f.write(str(price))
+    """Speichere den AVG Price (im Speicher, verzögert auf Disk)."""
+    settings_store.write(AVG_PRICE_FILE, price)
 
 def load_avg_price():
-    """Lade den gespeicherten AVG Price."""
-    if os.path.exists(AVG_PRICE_FILE):
-        with open(AVG_PRICE_FILE, "r") as f:
-            try:
-                return float(f.read().strip())
-            except:
-                return 0.0
+    """Lade den gespeicherten AVG Price aus dem Speicher."""
+    text = settings_store.read(AVG_PRICE_FILE)
+    if text is not None:
+        try:
+            return float(text.strip())
+        except:
+            return 0.0
     return 0.0
 
 def calculate_profit_percentage(avg_price, current_price):
@@ -900,95 +2408,184 @@ def open_notebook():
 
 # ====== BTC VALUE FUNCTIONS ======
 def save_btc_value(value):
-    with open(BTC_VALUE_FILE, "w") as f:
-        f.write(str(value))
+    settings_store.write(BTC_VALUE_FILE, value)
 
 def load_btc_value():
-    if os.path.exists(BTC_VALUE_FILE):
-        with open(BTC_VALUE_FILE, "r") as f:
-            try:
-                return float(f.read().strip())
-            except:
-                return 0.0
+    text = settings_store.read(BTC_VALUE_FILE)
+    if text is not None:
+        try:
+            return float(text.strip())
+        except:
+            return 0.0
     return 0.0
 
 # ====== PRICE ANIMATION ======
-def animate_price_change(label, start_price, end_price, duration=150, steps=50):
+class AnimationClock:
+    """Ein frame-getakteter Loop (60 Hz) für alle Tweens; ein neues Ziel übernimmt die laufende Animation"""
+    FRAME_TIME = 1 / 60
+    
+    def __init__(self):
+        self.tweens = {}
+        self.timer = None
+        self.timer_owner = None
+        self.next_frame = 0.0
+        self.stats = {
+            'frames': 0, 'skipped_frames': 0, 'retargets': 0, 'label_updates': 0,
+            'frame_time_total': 0.0, 'frame_time_max': 0.0
+        }
+    
+    def animate(self, widget, start_value, end_value, format_text, duration=0.15):
+        """Tweent widget von start_value nach end_value; läuft schon ein Tween, startet er vom aktuellen Wert"""
+        now = time.perf_counter()
+        tween = self.tweens.get(widget)
+        if tween is not None:
+            start_value = tween['current']
+            self.stats['retargets'] += 1
+        
+        self.tweens[widget] = {
+            'start': start_value,
+            'end': end_value,
+            'current': start_value,
+            'start_time': now,
+            'duration': duration,
+            'format_text': format_text,
+            'text': tween['text'] if tween is not None else None
+        }
+        
+        if self.timer is None:
+            self.next_frame = now
+            self.timer_owner = widget
+            self.timer = widget.after(0, self.tick)
+    
+    def cancel(self, widget):
+        self.tweens.pop(widget, None)
+    
+    def tick(self):
+        self.timer = None
+        frame_start = time.perf_counter()
+        
+        # Unter Last: verpasste Frames werden übersprungen, der Fortschritt hängt an der Uhrzeit
+        late = frame_start - self.next_frame
+        if late > self.FRAME_TIME:
+            self.stats['skipped_frames'] += int(late / self.FRAME_TIME)
+        
+        for widget, tween in list(self.tweens.items()):
+            if tween['duration'] > 0:
+                progress = min(1.0, (frame_start - tween['start_time']) / tween['duration'])
+            else:
+                progress = 1.0
+            tween['current'] = tween['start'] + (tween['end'] - tween['start']) * progress
+            
+            # Nur bei geändertem Text konfigurieren
+            text = tween['format_text'](tween['current'])
+            if text != tween['text']:
+                try:
+                    widget.config(text=text)
+                except tk.TclError:
+                    del self.tweens[widget]
+                    continue
+                tween['text'] = text
+                self.stats['label_updates'] += 1
+            
+            if progress >= 1.0:
+                del self.tweens[widget]
+        
+        frame_time = time.perf_counter() - frame_start
+        self.stats['frames'] += 1
+        self.stats['frame_time_total'] += frame_time
+        self.stats['frame_time_max'] = max(self.stats['frame_time_max'], frame_time)
+        
+        if self.tweens:
+            # Drift-Kompensation: Takt am Soll-Zeitpunkt ausrichten, nicht an after()-Verzögerungen
+            self.next_frame += self.FRAME_TIME
+            if self.next_frame <= frame_start:
+                self.next_frame = frame_start + self.FRAME_TIME
+            delay = max(1, round((self.next_frame - time.perf_counter()) * 1000))
+            self.timer = self.timer_owner.after(delay, self.tick)
+    
+    def get_frame_stats(self):
+        """Mittlere und maximale Frame-Dauer in Millisekunden"""
+        frames = max(self.stats['frames'], 1)
+        return {
+            'frames': self.stats['frames'],
+            'skipped_frames': self.stats['skipped_frames'],
+            'avg_frame_ms': self.stats['frame_time_total'] / frames * 1000,
+            'max_frame_ms': self.stats['frame_time_max'] * 1000
+        }
+
+animation_clock = AnimationClock()
+
+def animate_price_change(label, start_price, end_price, duration=150):
     """Animate the price label."""
     symbol = get_currency_symbol()
     if start_price == 0:
         start_price = end_price * 0.99
     
-    price_difference = end_price - start_price
-    step_value = price_difference / steps
-    delay = duration // steps
-
-    def update_price(step=0):
-        if step <= steps:
-            current_price = start_price + step_value * step
-            label.config(text=f"₿itcoin: {symbol}{current_price:.2f}")
-            label.after(delay, update_price, step + 1)
-        else:
-            label.config(text=f"₿itcoin: {symbol}{end_price:.2f}")
-
-    update_price()
+    # Unsichtbar: kein Tween, der Endwert wird im nächsten Frame gesetzt
+    if not visibility_monitor.visible:
+        duration = 0
+    animation_clock.animate(label, start_price, end_price,
+                            lambda price: f"₿itcoin: {symbol}{price:.2f}",
+                            duration=duration / 1000)
 
 # ====== GRAPH FUNCTIONS ======
-def plot_historical_prices_data(ax, historical_data):
-    """Plottet historische Daten (schnelle Version)"""
-    if not historical_data:
-        plot_no_data(ax)
-        return
-    
-    dates = [x[0] for x in historical_data]
-    opens = [x[1] for x in historical_data]
-    highs = [x[2] for x in historical_data]
-    lows = [x[3] for x in historical_data]
-    closes = [x[4] for x in historical_data]
-    
-    ax.clear()
-    ax.set_facecolor('#212121')
-    
-    # Optimiertes Zeichnen
-    for i in range(len(dates)):
-        color = bullish_color if closes[i] >= opens[i] else bearish_color
-        
-        ax.plot([dates[i], dates[i]], 
-                [opens[i], closes[i]], 
-                color=color, 
-                linewidth=1.0,
-                solid_capstyle='round')
-        
-        ax.plot([dates[i], dates[i]], 
-                [highs[i], max(opens[i], closes[i])], 
-                color=color, 
-                linewidth=0.6)
-        ax.plot([dates[i], dates[i]], 
-                [min(opens[i], closes[i]), lows[i]], 
-                color=color, 
-                linewidth=0.6)
-    
-    # Heikin-Ashi Linie
-    ha_closes = []
-    ha_opens = []
-    for i in range(len(historical_data)):
-        if i == 0:
-            ha_close = (opens[i] + highs[i] + lows[i] + closes[i]) / 4
-            ha_open = opens[i]
-        else:
-            ha_close = (opens[i] + highs[i] + lows[i] + closes[i]) / 4
-            ha_open = (ha_opens[i-1] + ha_closes[i-1]) / 2
-        ha_closes.append(ha_close)
-        ha_opens.append(ha_open)
-    
-    ax.plot(dates, ha_closes, 
-           color=theme_color, 
-           linewidth=1.0, 
-           alpha=0.5,
-           linestyle='-')
-    
-    # Mittelpreis-Berechnung
+def draw_candles(ax, dates, opens, highs, lows, closes):
+    """Zeichnet alle Kerzen mit zwei LineCollections statt drei Line2D pro Kerze"""
+    body_lows = np.minimum(opens, closes)
+    body_highs = np.maximum(opens, closes)
+    colors = np.where(closes >= opens, bullish_color, bearish_color)
+    
+    bodies = ax.vlines(dates, body_lows, body_highs,
+                       colors=colors,
+                       linewidth=1.0,
+                       capstyle='round')
+    
+    # Obere und untere Dochte in einer Collection
+    wicks = ax.vlines(np.concatenate((dates, dates)),
+                      np.concatenate((body_highs, lows)),
+                      np.concatenate((highs, body_lows)),
+                      colors=np.concatenate((colors, colors)),
+                      linewidth=0.6)
+    return bodies, wicks
+
+# ====== LEVEL OF DETAIL ======
+LOD_POINTS_PER_PIXEL = 2  # mehr Punkte pro Pixel Chartbreite zeichnen sich nur übereinander
+
+def decimate_candles(candles, max_count):
+    """Fasst je k benachbarte Kerzen zu einer zusammen: Open/Close außen, High/Low als Extremwerte"""
+    n = len(candles)
+    if n <= max_count:
+        return candles
+    k = math.ceil(n / max_count)
+    starts = np.arange(0, n, k)
+    ends = np.minimum(starts + k, n) - 1
+    values = np.empty((5, len(starts)), dtype=np.float64)
+    values[0] = candles.opens[starts]
+    values[1] = np.maximum.reduceat(candles.highs, starts)
+    values[2] = np.minimum.reduceat(candles.lows, starts)
+    values[3] = candles.closes[ends]
+    values[4] = np.add.reduceat(candles.volumes, starts)
+    return CandleStore(candles.times[starts], values)
+
+def decimate_minmax(x, y, max_points):
+    """Reduziert eine Linie auf Minimum und Maximum pro Bucket (max_points/2 Buckets), Ausreißer bleiben sichtbar"""
+    n = len(y)
+    if n <= max_points:
+        return x, y
+    k = math.ceil(n / (max_points // 2))
+    full = n // k * k
+    rows = y[:full].reshape(-1, k)
+    offsets = np.arange(0, full, k)
+    indices = [offsets + rows.argmin(axis=1), offsets + rows.argmax(axis=1), [0, n - 1]]
+    if full < n:
+        indices.append([full + int(np.argmin(y[full:])), full + int(np.argmax(y[full:]))])
+    keep = np.unique(np.concatenate(indices))
+    return x[keep], y[keep]
+
+def calculate_mid_price(historical_data):
+    """Berechnet den mittleren (High+Low)/2-Preis im Zeitfenster des gewählten Zeitraums"""
     symbol = get_currency_symbol()
+    times = historical_data.times
     time_delta = timedelta(hours=12)
     
     if current_time_range == '12h':
@@ -1008,69 +2605,381 @@ def plot_historical_prices_data(ax, historical_data):
         time_delta = datetime.now() - start_of_year
         label_text = f'  YTD Mid:\n{symbol}' + '{:.2f}'
     elif current_time_range == 'ALL':
-        time_delta = dates[-1] - dates[0] if dates else timedelta(days=365)
+        time_delta = timedelta(seconds=int(times[-1] - times[0]))
         label_text = f'  All Mid:\n{symbol}' + '{:.2f}'
     
-    cutoff_time = datetime.now() - time_delta
-    mid_prices = []
-    
-    for data in historical_data:
-        timestamp, open_price, high, low, close = data
-        if timestamp >= cutoff_time:
-            mid_prices.append((high + low) / 2)
-    
-    if mid_prices:
-        avg_mid_price = sum(mid_prices) / len(mid_prices)
-        ax.axhline(y=avg_mid_price, color='white', linestyle='--', linewidth=0.5, alpha=0.5)
-        
-        ax.text(1.02,
-                avg_mid_price,
-                f'{label_text.format(avg_mid_price)}', 
-                transform=ax.get_yaxis_transform(),
-                color='white', 
-                fontsize=7, alpha=1.0,
-                verticalalignment='center',
-                horizontalalignment='left',
-                bbox=dict(facecolor='#212121', edgecolor='none', pad=2))
-    
-    # Formatierung
-    ax.set_ylabel(get_currency_code(), color=theme_color, fontsize=8)
-    ax.spines[:].set_color(theme_color)
-    ax.tick_params(axis='both', colors=theme_color, labelsize=9)
-    ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M' if current_time_range == '12h' else '%d-%m'))
-    ax.grid(color='#676767', linestyle=':', linewidth=1.0, alpha=0.5)
-    
-    canvas.draw()
+    cutoff_time = time.time() - time_delta.total_seconds()
+    return get_mid_price_stats(historical_data).mean(cutoff_time), label_text
+
+class ChartRenderer:
+    """Hält die Chart-Artists; solange nur die Live-Kerze sich ändert, wird per Blitting aktualisiert"""
+    def __init__(self, ax, canvas):
+        self.ax = ax
+        self.canvas = canvas
+        self.artists = None
+        self.layout_key = None
+        self.limits = None
+        self.background = None
+        self.live_date = None
+        self.data = None
+        self.view = None
+        self.view_key = None
+        self.ha_engine = HeikinAshiEngine()
+        self.stats = {'full_redraws': 0, 'blit_updates': 0, 'candles_drawn': 0, 'candles_total': 0}
+        # Jeder volle Draw (auch Zoom) erneuert den Hintergrund für das Blitting
+        canvas.mpl_connect('draw_event', self.on_draw)
+    
+    def get_layout_key(self, historical_data):
+        """Ändert sich, sobald eine Kerze schließt oder Zeitraum/Währung/Farbe wechseln"""
+        times = historical_data.times
+        return (current_time_range, CURRENCY, theme_color, len(times), int(times[0]), int(times[-1]))
+    
+    def render(self, historical_data):
+        if not len(historical_data):
+            plot_no_data(self.ax)
+            return
+        
+        if (self.artists is None or self.background is None
+                or self.get_layout_key(historical_data) != self.layout_key
+                or (self.ax.get_xlim(), self.ax.get_ylim()) != self.limits
+                or not self.live_candle_fits(historical_data)):
+            self.full_redraw(historical_data)
+        else:
+            self.update_live(historical_data)
+    
+    def reset(self):
+        self.artists = None
+        self.layout_key = None
+        self.background = None
+    
+    def live_candle_fits(self, historical_data):
+        if self.view is not None:
+            # Gezoomt bleiben die Grenzen fest, eine Neuzeichnung würde sie nicht verschieben
+            return True
+        y_min, y_max = self.ax.get_ylim()
+        return y_min <= historical_data.lows[-1] and historical_data.highs[-1] <= y_max
+    
+    def set_view(self, xlim, ylim):
+        """Zoom/Pan: neue Achsengrenzen, die Dezimierung wird für den sichtbaren Ausschnitt neu berechnet"""
+        self.view = (tuple(xlim), tuple(ylim))
+        self.view_key = (current_time_range, CURRENCY)
+        if self.data is not None and len(self.data):
+            self.full_redraw(self.data, idle=True)
+        else:
+            self.ax.set_xlim(xlim)
+            self.ax.set_ylim(ylim)
+            self.canvas.draw_idle()
+    
+    def get_visible_range(self, dates):
+        """Indexbereich der geschlossenen Kerzen im gezoomten Ausschnitt (je eine Kerze Rand)"""
+        if self.view is None:
+            return 0, len(dates)
+        x_min, x_max = self.view[0]
+        first = max(0, int(np.searchsorted(dates, x_min)) - 1)
+        last = min(len(dates), int(np.searchsorted(dates, x_max)) + 1)
+        return first, last
+    
+    def reset_view(self, historical_data):
+        """Zurück zur automatischen Skalierung über alle Kerzen"""
+        self.view = None
+        if historical_data is not None and len(historical_data):
+            self.full_redraw(historical_data, idle=True)
+    
+    def full_redraw(self, historical_data, idle=False):
+        """Baut alle Artists neu auf; Live-Kerze, HA-Ende und Mid-Linie werden animiert.
+        idle=True zeichnet erst im nächsten Leerlauf des Tk-Loops (Zoom/Pan)."""
+        ax = self.ax
+        self.data = historical_data
+        # Anderer Zeitraum oder andere Währung: Zoom verwerfen
+        if self.view is not None and self.view_key != (current_time_range, CURRENCY):
+            self.view = None
+        
+        dates = historical_data.dates()
+        opens = historical_data.opens
+        highs = historical_data.highs
+        lows = historical_data.lows
+        closes = historical_data.closes
+        
+        ax.clear()
+        ax.set_facecolor('#212121')
+        
+        # Höchstens ~2 Punkte pro Pixel: Kerzen und HA-Linie im sichtbaren Ausschnitt dezimieren
+        max_points = max(2, int(ax.bbox.width * LOD_POINTS_PER_PIXEL))
+        first, last = self.get_visible_range(dates[:-1])
+        closed = decimate_candles(CandleStore(historical_data.times[first:last],
+                                              historical_data.value_buffer[:, first:last]), max_points)
+        
+        # Geschlossene Kerzen landen im Hintergrund, die offene wird separat gezeichnet
+        draw_candles(ax, closed.dates(), closed.opens, closed.highs, closed.lows, closed.closes)
+        live_body, live_wick = draw_candles(ax, dates[-1:], opens[-1:], highs[-1:], lows[-1:], closes[-1:])
+        self.stats['candles_drawn'] = len(closed) + 1
+        self.stats['candles_total'] = len(historical_data)
+        
+        # Heikin-Ashi Linie
+        ha_closes = self.ha_engine.update(historical_data).closes
+        ha_dates, ha_values = decimate_minmax(dates[first:last], ha_closes[first:last], max_points)
+        ax.plot(ha_dates, ha_values, 
+               color=theme_color, 
+               linewidth=1.0, 
+               alpha=0.5,
+               linestyle='-')
+        ha_tail, = ax.plot(dates[-2:], ha_closes[-2:], 
+                          color=theme_color, 
+                          linewidth=1.0, 
+                          alpha=0.5,
+                          linestyle='-')
+        
+        # Mittelpreis-Linie
+        avg_mid_price, label_text = calculate_mid_price(historical_data)
+        mid_y = avg_mid_price if avg_mid_price is not None else closes[-1]
+        mid_line = ax.axhline(y=mid_y, color='white', linestyle='--', linewidth=0.5, alpha=0.5)
+        mid_text = ax.text(1.02,
+                           mid_y,
+                           f'{label_text.format(mid_y)}', 
+                           transform=ax.get_yaxis_transform(),
+                           color='white', 
+                           fontsize=7, alpha=1.0,
+                           verticalalignment='center',
+                           horizontalalignment='left',
+                           bbox=dict(facecolor='#212121', edgecolor='none', pad=2))
+        mid_line.set_visible(avg_mid_price is not None)
+        mid_text.set_visible(avg_mid_price is not None)
+        
+        # Formatierung
+        ax.set_ylabel(get_currency_code(), color=theme_color, fontsize=8)
+        ax.spines[:].set_color(theme_color)
+        ax.tick_params(axis='both', colors=theme_color, labelsize=9)
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M' if current_time_range == '12h' else '%d-%m'))
+        ax.grid(color='#676767', linestyle=':', linewidth=1.0, alpha=0.5)
+        if self.view is not None:
+            ax.set_xlim(self.view[0])
+            ax.set_ylim(self.view[1])
+        
+        self.artists = {
+            'live_body': live_body, 'live_wick': live_wick, 'ha_tail': ha_tail,
+            'mid_line': mid_line, 'mid_text': mid_text, 'label_text': label_text
+        }
+        for key in ('live_body', 'live_wick', 'ha_tail', 'mid_line', 'mid_text'):
+            self.artists[key].set_animated(True)
+        self.layout_key = self.get_layout_key(historical_data)
+        self.live_date = dates[-1]
+        self.stats['full_redraws'] += 1
+        
+        if idle:
+            # Bis zum Zeichnen gibt es keinen gültigen Hintergrund für das Blitting
+            self.background = None
+            self.canvas.draw_idle()
+        else:
+            self.canvas.draw()
+        self.limits = (ax.get_xlim(), ax.get_ylim())
+        
+        record_first_chart()
+    
+    def update_live(self, historical_data):
+        """Aktualisiert nur Live-Kerze, HA-Ende und Mid-Linie und blittet sie über den Hintergrund"""
+        x = self.live_date
+        open_price = historical_data.opens[-1]
+        high = historical_data.highs[-1]
+        low = historical_data.lows[-1]
+        close = historical_data.closes[-1]
+        color = bullish_color if close >= open_price else bearish_color
+        body_low, body_high = min(open_price, close), max(open_price, close)
+        
+        artists = self.artists
+        artists['live_body'].set_segments([[(x, body_low), (x, body_high)]])
+        artists['live_body'].set_color(color)
+        artists['live_wick'].set_segments([[(x, body_high), (x, high)], [(x, low), (x, body_low)]])
+        artists['live_wick'].set_color(color)
+        
+        artists['ha_tail'].set_ydata(self.ha_engine.update(historical_data).closes[-2:])
+        
+        avg_mid_price, label_text = calculate_mid_price(historical_data)
+        if avg_mid_price is not None:
+            artists['mid_line'].set_ydata([avg_mid_price, avg_mid_price])
+            artists['mid_text'].set_y(avg_mid_price)
+            artists['mid_text'].set_text(label_text.format(avg_mid_price))
+        artists['mid_line'].set_visible(avg_mid_price is not None)
+        artists['mid_text'].set_visible(avg_mid_price is not None)
+        
+        self.canvas.restore_region(self.background)
+        self.draw_animated()
+        self.canvas.blit(self.canvas.figure.bbox)
+        self.stats['blit_updates'] += 1
+    
+    def draw_animated(self):
+        for key in ('live_body', 'live_wick', 'ha_tail', 'mid_line', 'mid_text'):
+            self.ax.draw_artist(self.artists[key])
+    
+    def on_draw(self, event):
+        """Speichert den statischen Hintergrund und legt die animierten Artists darüber"""
+        if self.artists is None:
+            return
+        self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self.draw_animated()
+
+# Im Fenster in main angelegt; headless gibt es keinen Chart
+chart_renderer = None
+zoom_controller = None
+
+def plot_historical_prices_data(ax, historical_data):
+    """Plottet historische Daten (inkrementell, volle Neuzeichnung nur bei neuer Kerze)"""
+    chart_renderer.render(zoom_controller.splice(historical_data))
 
 def plot_no_data(ax):
     """Zeigt Fehlermeldung wenn keine Daten"""
+    # Sonst blittet on_draw die alten Live-Artists über den Hinweis
+    chart_renderer.reset()
     ax.clear()
     ax.set_facecolor('#212121')
     ax.text(0.5, 0.5, 'No data available', color='white', 
             ha='center', va='center', transform=ax.transAxes)
     canvas.draw()
 
-def zoom(event):
-    """Zoom function for the graph."""
-    scale_factor = 1.1 if event.delta > 0 else 0.9
+class ZoomController:
+    """Zoom (Mausrad) und Pan (Ziehen) sammeln sich pro Frame zu einem draw_idle; reicht der Ausschnitt
+    vor die geladenen Kerzen, wird ältere Historie im Hintergrund nachgeladen"""
+    FRAME_MS = 16
     
-    xlim = ax.get_xlim()
-    ylim = ax.get_ylim()
-    
-    x_data, y_data = ax.transData.inverted().transform((event.x, event.y))
-    
-    ax.set_xlim([x_data - (x_data - xlim[0]) * scale_factor,
-                 x_data + (xlim[1] - x_data) * scale_factor])
-    
-    ax.set_ylim([y_data - (y_data - ylim[0]) * scale_factor,
-                 y_data + (ylim[1] - y_data) * scale_factor])
-    
-    canvas.draw()
+    def __init__(self, renderer, widget):
+        self.renderer = renderer
+        self.widget = widget
+        self.timer = None
+        self.scale = 1.0
+        self.anchor = None
+        self.pan = [0, 0]
+        self.drag_from = None
+        self.raw = None
+        self.history = CandleStore()
+        self.history_key = None
+        self.loading = None
+        self.exhausted = set()
+        self.stats = {'wheel_events': 0, 'drag_events': 0, 'frames': 0, 'history_loads': 0, 'history_candles': 0}
+    
+    def bind(self):
+        self.widget.bind("<MouseWheel>", self.on_wheel)
+        self.widget.bind("<ButtonPress-1>", self.on_press)
+        self.widget.bind("<B1-Motion>", self.on_drag)
+        self.widget.bind("<Double-Button-1>", self.on_reset)
+    
+    def on_wheel(self, event):
+        self.scale *= 0.9 if event.delta > 0 else 1.1
+        self.anchor = (event.x, event.y)
+        self.stats['wheel_events'] += 1
+        self.schedule()
+    
+    def on_press(self, event):
+        self.drag_from = (event.x, event.y)
+        # Sonst verschiebt die Toplevel-Bindung (Fenster ziehen) zusätzlich das ganze Fenster
+        return "break"
+    
+    def on_drag(self, event):
+        if self.drag_from is None:
+            return "break"
+        self.pan[0] += event.x - self.drag_from[0]
+        self.pan[1] += event.y - self.drag_from[1]
+        self.drag_from = (event.x, event.y)
+        self.stats['drag_events'] += 1
+        self.schedule()
+        return "break"
+    
+    def on_reset(self, event):
+        """Doppelklick: Zoom und nachgeladene Historie verwerfen"""
+        self.history_key = None
+        self.renderer.reset_view(self.raw)
+    
+    def schedule(self):
+        if self.timer is None:
+            self.timer = self.widget.after(self.FRAME_MS, self.apply)
+    
+    def apply(self):
+        """Alle seit dem letzten Frame gesammelten Eingaben als eine neue Ansicht"""
+        self.timer = None
+        ax = self.renderer.ax
+        (x_min, x_max), (y_min, y_max) = ax.get_xlim(), ax.get_ylim()
+        bbox = ax.bbox
+        
+        # Pan: Pixel in Datenkoordinaten (Tk zählt y von oben)
+        dx = self.pan[0] * (x_max - x_min) / bbox.width
+        dy = self.pan[1] * (y_max - y_min) / bbox.height
+        x_min, x_max, y_min, y_max = x_min - dx, x_max - dx, y_min + dy, y_max + dy
+        
+        # Zoom um den Mauszeiger; Matplotlib zählt y von unten
+        if self.scale != 1.0 and self.anchor is not None:
+            x_data, y_data = ax.transData.inverted().transform(
+                (self.anchor[0], self.renderer.canvas.figure.bbox.height - self.anchor[1]))
+            x_min, x_max = x_data - (x_data - x_min) * self.scale, x_data + (x_max - x_data) * self.scale
+            y_min, y_max = y_data - (y_data - y_min) * self.scale, y_data + (y_max - y_data) * self.scale
+        
+        self.scale = 1.0
+        self.pan = [0, 0]
+        self.stats['frames'] += 1
+        self.renderer.set_view((x_min, x_max), (y_min, y_max))
+        self.request_history(x_min)
+    
+    def splice(self, historical_data):
+        """Setzt nachgeladene ältere Kerzen vor die aktuelle Serie"""
+        self.raw = historical_data
+        if self.history_key != (current_time_range, CURRENCY) or not len(historical_data):
+            return historical_data
+        return historical_data.prepend(self.history.slice_until(historical_data.times[0]))
+    
+    def request_history(self, x_min):
+        """Lädt ältere Kerzen, wenn der Ausschnitt vor der geladenen Serie beginnt"""
+        data = self.renderer.data
+        key = (current_time_range, CURRENCY)
+        if data is None or not len(data) or x_min >= data.dates()[0]:
+            return
+        if self.loading == key or key in self.exhausted:
+            return
+        
+        # Matplotlib-Datum (lokale Zeit) zurück nach Epoch
+        local_seconds = int((x_min - mdates.date2num(np.datetime64('1970-01-01'))) * 86400)
+        before = local_seconds - time.localtime(local_seconds).tm_gmtoff
+        until = int(data.times[0])
+        interval = TIME_RANGES[current_time_range]['interval']
+        pair, pair_key = get_ohlc_pair()
+        self.loading = key
+        job_scheduler.submit(f'history {pair} {current_time_range}',
+                             lambda: self.load_history(key, pair, pair_key, interval, before, until),
+                             PRIORITY_OHLC, KRAKEN_HOST)
+    
+    def load_history(self, key, pair, pair_key, interval, before, until):
+        """Läuft im Scheduler-Thread; das Ergebnis geht über die Queue zurück in den Tk-Loop"""
+        try:
+            candles = load_older_candles(pair, pair_key, interval, before, until)
+        except Exception:
+            candles = CandleStore()
+        historical_queue.put(('chart_history', (key, candles)))
+    
+    def set_history(self, key, candles):
+        """Übernimmt nachgeladene Kerzen (Tk-Thread); gibt die neu zu zeichnende Serie zurück oder None"""
+        self.loading = None
+        if key != (current_time_range, CURRENCY):
+            return None
+        extends = self.history_key == key and len(self.history)
+        if extends:
+            # Nur was vor dem bisher nachgeladenen Stück liegt, davor setzen: die Serie bleibt lückenlos
+            candles = candles.slice_until(self.history.times[0])
+        if not len(candles):
+            # Weiter zurück gibt Kraken nichts her
+            self.exhausted.add(key)
+            return None
+        self.history = self.history.prepend(candles) if extends else candles.copy()
+        self.history_key = key
+        self.stats['history_loads'] += 1
+        self.stats['history_candles'] = len(self.history)
+        return self.raw
 
 def change_time_range(event):
     global current_time_range
     current_time_range = time_range_var.get()
-    executor.submit(fetch_historical_prices_thread)
+    
+    # Aus dem Cache sofort zeichnen (nächster Frame), der Abgleich läuft danach im Hintergrund
+    pair, pair_key = get_ohlc_pair()
+    cached_data = get_candle_pyramid(pair, pair_key).view(current_time_range)
+    if cached_data is not None:
+        historical_queue.put(('historical_data', cached_data))
+    job_scheduler.run_now('ohlc')
 
 # ====== CONVERSION FUNCTIONS ======
 def update_conversion(event=None):
@@ -1128,8 +3037,7 @@ def pick_theme():
         color_picker.destroy()
 
     def save_theme_color(color):
-        with open(THEME_COLOR_FILE, "w") as f:
-            f.write(color)
+        settings_store.write(THEME_COLOR_FILE, color)
 
     for i, color in enumerate(preset_colors + custom_colors):
         color_button = tk.Button(color_picker, bg=color, width=4, height=2, 
@@ -1280,11 +3188,10 @@ def refresh_ui_for_currency():
     symbol = get_currency_symbol()
     code = get_currency_code()
     
-    # Aktualisiere alle Preise neu
-    executor.submit(fetch_bitcoin_price_thread)
-    executor.submit(fetch_historical_prices_thread)
-    executor.submit(fetch_fx_rate_thread)
-    executor.submit(fetch_opposite_currency_price)  # Gegenteiligen Preis auch
+    # Aktualisiere alle Preise neu (inkl. gegenteiligem Preis und Wechselkurs)
+    job_scheduler.run_now('price')
+    job_scheduler.run_now('ohlc')
+    prefetch_time_ranges()
     
     # Converter Labels aktualisieren
     eur_label.config(text=f"{code} :")
@@ -1295,135 +3202,212 @@ def refresh_ui_for_currency():
     else:  # EUR
         btc_rate_label.config(text="1 BTC = 0.00 $")
 
-# ====== ASYNCHRONE UPDATE FUNKTIONEN ======
-def update_price_label_async():
-    """Aktualisiert den Preis-Label asynchron"""
-    executor.submit(fetch_bitcoin_price_thread)
-    # Auch gegenteiligen Preis aktualisieren
-    executor.submit(fetch_opposite_currency_price)
-    root.after(10000, update_price_label_async)
-
-def update_graph_async():
-    """Aktualisiert den Graphen asynchron"""
-    executor.submit(fetch_historical_prices_thread)
-    root.after(60000, update_graph_async)
-
-def update_fear_greed_async():
-    """Aktualisiert Fear & Greed asynchron"""
-    executor.submit(fetch_fear_greed_thread)
-    root.after(60000, update_fear_greed_async)
-
-def update_rates_async():
-    """Aktualisiert Wechselkurse asynchron"""
-    executor.submit(fetch_fx_rate_thread)
-    root.after(10000, update_rates_async)
-
-def update_high_low_async():
-    """Aktualisiert High/Low asynchron"""
-    executor.submit(fetch_historical_prices_thread)
-    root.after(60000, update_high_low_async)
-
-def update_percentage_change_async():
-    """Aktualisiert Prozent-Änderung asynchron"""
-    executor.submit(fetch_historical_prices_thread)
-    root.after(10000, update_percentage_change_async)
+# ====== VISIBILITY ======
+HIDDEN_POLL_SCALE = 6  # Poll-Intervalle im Hintergrund x6 (Preis 10 s -> 1 min)
+VISIBILITY_POLL = 1.0  # Sekunden; Fensterzustand abfragen statt auf Map/Unmap zu warten
+
+class VisibilityMonitor:
+    """Pausiert das Chart-Rendering und drosselt das Polling, solange das Fenster nicht sichtbar ist"""
+    def __init__(self):
+        self.root = None
+        self.visible = True
+        self.obscured = False
+        self.pending_chart = None
+        self.since = time.monotonic()
+        self.cpu_since = time.process_time()
+        self.requests_since = 0
+        self.totals = {
+            True: {'seconds': 0.0, 'cpu_seconds': 0.0, 'requests': 0},
+            False: {'seconds': 0.0, 'cpu_seconds': 0.0, 'requests': 0}
+        }
+        self.stats = {'hidden': 0, 'shown': 0, 'charts_deferred': 0, 'catch_ups': 0}
+    
+    def attach(self, root, widget):
+        """Fragt den Fensterzustand über den Scheduler ab (überall verfügbar); Verdeckung melden
+        zusätzlich Visibility-Events, wo das Fenstersystem sie liefert (nur X11)"""
+        self.root = root
+        self.requests_since = self.count_requests()
+        widget.bind('<Visibility>', self.on_visibility, add='+')
+        # Ungeskaliert, sonst würde das Sichtbarwerden im Hintergrund erst nach 6 s erkannt
+        job_scheduler.add('visibility', lambda: ui_dispatcher.call_soon(self.poll), VISIBILITY_POLL,
+                          PRIORITY_LOCAL, None, scaled=False)
+    
+    def poll(self):
+        """Im Tk-Thread: minimiert (iconic), versteckt (withdrawn) oder nicht abgebildet zählt als unsichtbar"""
+        try:
+            mapped = self.root.state() not in ('iconic', 'withdrawn') and self.root.winfo_viewable()
+        except tk.TclError:
+            return
+        self.set_visible(bool(mapped) and not self.obscured)
+    
+    def on_visibility(self, event):
+        self.obscured = event.state == 'VisibilityFullyObscured'
+        self.poll()
+    
+    def count_requests(self):
+        return sum(entry['requests'] for entry in http_client.get_stats().values())
+    
+    def close_period(self):
+        """Bucht Zeit, CPU und Requests seit dem letzten Wechsel auf sichtbar/versteckt"""
+        now, cpu, requests_count = time.monotonic(), time.process_time(), self.count_requests()
+        totals = self.totals[self.visible]
+        totals['seconds'] += now - self.since
+        totals['cpu_seconds'] += cpu - self.cpu_since
+        totals['requests'] += requests_count - self.requests_since
+        self.since, self.cpu_since, self.requests_since = now, cpu, requests_count
+    
+    def set_visible(self, visible):
+        if visible == self.visible:
+            return
+        self.close_period()
+        self.visible = visible
+        if not visible:
+            self.stats['hidden'] += 1
+            job_scheduler.set_scale(HIDDEN_POLL_SCALE)
+            return
+        
+        # Wieder sichtbar: zuletzt zurückgestellten Chart zeichnen, dann ein inkrementeller Abgleich
+        self.stats['shown'] += 1
+        job_scheduler.set_scale(1.0)
+        if self.pending_chart is not None:
+            data, self.pending_chart = self.pending_chart, None
+            plot_historical_prices_data(ax, data)
+        self.stats['catch_ups'] += 1
+        job_scheduler.run_now('ohlc')
+    
+    def defer_chart(self, data):
+        """Gibt True zurück, wenn der Chart bis zum nächsten Sichtbarwerden warten soll"""
+        if self.visible:
+            return False
+        self.pending_chart = data
+        self.stats['charts_deferred'] += 1
+        return True
+    
+    def get_report(self):
+        """CPU-Sekunden und Requests pro Stunde sichtbar vs. versteckt, hochgerechnet auf einen Tag im Hintergrund"""
+        self.close_period()
+        report = dict(self.stats)
+        rates = {}
+        for visible, totals in self.totals.items():
+            hours = totals['seconds'] / 3600
+            rates[visible] = {
+                'cpu_seconds_per_hour': totals['cpu_seconds'] / hours if hours else None,
+                'requests_per_hour': totals['requests'] / hours if hours else None
+            }
+        report['while_visible'] = rates[True]
+        report['while_hidden'] = rates[False]
+        if all(rate['cpu_seconds_per_hour'] is not None for rate in rates.values()):
+            report['saved_per_idle_day'] = {
+                'cpu_seconds': (rates[True]['cpu_seconds_per_hour'] - rates[False]['cpu_seconds_per_hour']) * 24,
+                'requests': (rates[True]['requests_per_hour'] - rates[False]['requests_per_hour']) * 24
+            }
+        return report
+
+visibility_monitor = VisibilityMonitor()
 
 # ====== QUEUE PROCESSING ======
+def config_changed(widget, **props):
+    """config() nur mit den Optionen, die sich geändert haben (spart Neu-Layouts bei gleichem Text)"""
+    changes = {prop: value for prop, value in props.items() if str(widget.cget(prop)) != str(value)}
+    if changes:
+        widget.config(**changes)
+
 def process_queues():
-    """Verarbeitet alle verfügbaren Queue-Nachrichten"""
+    """Verarbeitet den neuesten Stand jeder Mailbox (ein Dispatch pro Frame), gibt die Anzahl der Nachrichten zurück"""
+    processed = 0
+    
     # Preis Queue
-    try:
-        while True:
-            msg_type, data = price_queue.get_nowait()
-            if msg_type == 'bitcoin_price' and data is not None:
-                global last_price
-                if last_price == 0:
-                    last_price = data
-                    symbol = get_currency_symbol()
-                    price_label.config(text=f"₿itcoin: {symbol}{data:.2f}")
-                elif data != last_price:
-                    animate_price_change(price_label, last_price, data)
-                    last_price = data
+    for msg_type, data in price_queue.drain():
+        processed += 1
+        if msg_type == 'bitcoin_price' and data is not None:
+            global last_price
+            if last_price == 0:
+                last_price = data
+                symbol = get_currency_symbol()
+                config_changed(price_label, text=f"₿itcoin: {symbol}{data:.2f}")
+            elif data != last_price:
+                animate_price_change(price_label, last_price, data)
+                last_price = data
+            kraken_stream.record_display()
                 
-                # Speichere Preis basierend auf aktueller Währung
-                if CURRENCY == "USD":
-                    last_price_usd = data
-                else:
-                    last_price_eur = data
+            # Speichere Preis basierend auf aktueller Währung
+            if CURRENCY == "USD":
+                last_price_usd = data
+            else:
+                last_price_eur = data
                 
-                # Update Converter mit neuem Preis
-                try:
-                    btc_amount = float(btc_entry.get())
-                    currency_value = btc_amount * data
-                    symbol = get_currency_symbol()
-                    eur_value_label.config(text=f"{currency_value:.2f} {symbol}")
+            # Update Converter mit neuem Preis
+            try:
+                btc_amount = float(btc_entry.get())
+                currency_value = btc_amount * data
+                symbol = get_currency_symbol()
+                config_changed(eur_value_label, text=f"{currency_value:.2f} {symbol}")
                     
-                    avg_price = load_avg_price()
-                    if avg_price > 0:
-                        profit_percentage = calculate_profit_percentage(avg_price, data)
-                        if profit_percentage is not None:
-                            profit_color = "#6FAB65" if profit_percentage >= 0 else "#BD5959"
-                            percent_label_conversion.config(text=f"{profit_percentage:+.2f}%", fg=profit_color)
-                except:
-                    pass
-    except queue.Empty:
-        pass
+                avg_price = load_avg_price()
+                if avg_price > 0:
+                    profit_percentage = calculate_profit_percentage(avg_price, data)
+                    if profit_percentage is not None:
+                        profit_color = "#6FAB65" if profit_percentage >= 0 else "#BD5959"
+                        config_changed(percent_label_conversion, text=f"{profit_percentage:+.2f}%", fg=profit_color)
+            except:
+                pass
+        elif msg_type == 'opposite_price' and data is not None:
+            # Preis in der gegenteiligen Währung direkt von der API
+            opposite_symbol = "€" if CURRENCY == "USD" else "$"
+            config_changed(btc_rate_label, text=f"1 BTC = {data:.2f} {opposite_symbol}")
     
     # Historical Queue
-    try:
-        while True:
-            msg_type, data = historical_queue.get_nowait()
-            if msg_type == 'historical_data':
-                if data:
+    for msg_type, data in historical_queue.drain():
+        processed += 1
+        if msg_type == 'historical_data':
+            if len(data):
+                if not visibility_monitor.defer_chart(data):
                     plot_historical_prices_data(ax, data)
                     
-                    # Update High/Low
-                    if data:
-                        prices = [price[1] for price in data]
-                        highest_price = max(prices)
-                        symbol = get_currency_symbol()
-                        high_label.config(text=f"Top: {symbol}{highest_price:.2f}")
+                # Update High/Low
+                highest_price = data.opens.max()
+                symbol = get_currency_symbol()
+                config_changed(high_label, text=f"Top: {symbol}{highest_price:.2f}")
                     
-                    # Update Percentage Change
-                    if data and len(data) > 0:
-                        start_price = data[0][1]
-                        if last_price > 0:
-                            percentage_change = calculate_percentage_change(start_price, last_price)
-                            color = "#82ef82" if percentage_change >= 0 else "#ff4d4d"
-                            percent_label.config(text=f"{percentage_change:.2f}%", fg=color)
-                else:
-                    plot_no_data(ax)
-    except queue.Empty:
-        pass
+                # Update Percentage Change
+                if len(data) > 0:
+                    start_price = data.opens[0]
+                    if last_price > 0:
+                        percentage_change = calculate_percentage_change(start_price, last_price)
+                        color = "#82ef82" if percentage_change >= 0 else "#ff4d4d"
+                        config_changed(percent_label, text=f"{percentage_change:.2f}%", fg=color)
+            else:
+                plot_no_data(ax)
+        elif msg_type == 'chart_history':
+            raw = zoom_controller.set_history(*data)
+            if raw is not None and len(raw) and not visibility_monitor.defer_chart(raw):
+                plot_historical_prices_data(ax, raw)
     
     # Fear & Greed Queue
-    try:
-        while True:
-            msg_type, data = fear_greed_queue.get_nowait()
-            if msg_type == 'fear_greed':
-                index, classification = data
-                if index is not None:
-                    fg_color = "#ff4d4d" if index < 45 else "#ffb84d" if index < 60 else "#82ef82"
-                    fear_greed_label.config(text=f"{index} {classification}", fg=fg_color)
-                else:
-                    fear_greed_label.config(text="N/A", fg="grey")
-    except queue.Empty:
-        pass
+    for msg_type, data in fear_greed_queue.drain():
+        processed += 1
+        if msg_type == 'fear_greed':
+            index, classification = data
+            if index is not None:
+                fg_color = "#ff4d4d" if index < 45 else "#ffb84d" if index < 60 else "#82ef82"
+                config_changed(fear_greed_label, text=f"{index} {classification}", fg=fg_color)
+            else:
+                config_changed(fear_greed_label, text="N/A", fg="grey")
     
     # FX Rate Queue
-    try:
-        while True:
-            msg_type, data = fx_rate_queue.get_nowait()
-            if msg_type == 'fx_rate':
-                usd_eur_rate = data
-                if usd_eur_rate:
-                    # Wechselkurs anzeigen
-                    current_rate_label.config(text=f"1 USD = {usd_eur_rate:.4f} €")
-    except queue.Empty:
-        pass
-    
-    # Nächste Verarbeitung planen
-    root.after(100, process_queues)
+    for msg_type, data in fx_rate_queue.drain():
+        processed += 1
+        if msg_type == 'fx_rate':
+            usd_eur_rate = data
+            if usd_eur_rate:
+                # Wechselkurs anzeigen und offene Umrechnungen mit dem neuen Kurs auffrischen
+                config_changed(current_rate_label, text=f"1 USD = {usd_eur_rate:.4f} €")
+                if usd_entry.get():
+                    update_usd_eur_conversion()
+                if eur_usd_entry.get():
+                    update_eur_usd_conversion()
+    
+    return processed
 
 # ====== DEBOUNCED FUNCTIONS ======
 class Debouncer:
@@ -1439,51 +3423,269 @@ class Debouncer:
         self.timer = root.after(self.delay, lambda: self.func(*args, **kwargs))
 
 # ====== CONVERTER FUNCTIONS ======
-def get_usd_eur_rate_sync():
-    """Synchroner Wechselkurs für Converter"""
-    try:
-        url = 'https://api.kraken.com/0/public/Ticker?pair=USDTEUR'
-        response = requests.get(url, timeout=5)
-        data = response.json()
-        return float(data['result']['USDTEUR']['c'][0])
-    except:
-        return 0.92
+FX_STALE_COLOR = "#ffb84d"
+
+def get_converter_rate():
+    """Kurs für die Converter aus dem Cache, plus Label-Farbe als Veraltet-Anzeige"""
+    rate, stale = fx_rate_service.get()
+    return rate, FX_STALE_COLOR if stale else "grey"
 
 def update_usd_eur_conversion(event=None):
     """Aktualisiert USD zu EUR Converter"""
     try:
         usd_amount = float(usd_entry.get())
-        rate = get_usd_eur_rate_sync()
-        usd_eur_label.config(text=f"{usd_amount * rate:.2f} EUR")
+        rate, color = get_converter_rate()
+        usd_eur_label.config(text=f"{usd_amount * rate:.2f} EUR", fg=color)
     except:
-        usd_eur_label.config(text="Error")
+        usd_eur_label.config(text="Error", fg="grey")
 
 def update_eur_usd_conversion(event=None):
     """Aktualisiert EUR zu USD Converter"""
     try:
         eur_amount = float(eur_usd_entry.get())
-        rate = get_usd_eur_rate_sync()
-        eur_usd_label.config(text=f"{eur_amount / rate:.2f} USD")
+        rate, color = get_converter_rate()
+        eur_usd_label.config(text=f"{eur_amount / rate:.2f} USD", fg=color)
     except:
-        eur_usd_label.config(text="Error")
+        eur_usd_label.config(text="Error", fg="grey")
 
 # ====== OPTIMIZED EVENT HANDLING ======
 def on_closing():
     """Sauberes Beenden"""
+    job_scheduler.stop()
+    kraken_stream.stop()
     executor.shutdown(wait=False)
     save_window_position(root.winfo_x(), root.winfo_y())
     save_options_to_file()
+    settings_store.flush()
+    if PRINT_STATS:
+        print(json.dumps(get_app_stats(), indent=2))
     root.destroy()
     sys.exit(0)
 
+# ====== HEADLESS DAEMON ======
+HEADLESS_HOST = "127.0.0.1"
+HEADLESS_PORT = 8765
+SSE_HEARTBEAT = 15  # Sekunden; Kommentarzeile hält Proxies und tote Verbindungen im Blick
+HEADLESS_BACKLOG = 512  # Dashboards verbinden nach einem Neustart alle gleichzeitig neu
+
+class PushHub:
+    """Neuester Stand pro Ereignis; Abonnenten merken sich nur die zuletzt gesehene Version"""
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.version = 0
+        self.events = {}
+        self.subscribers = 0
+        self.stats = {'published': 0, 'unchanged': 0, 'sent': 0, 'subscribers_peak': 0}
+    
+    def publish(self, name, data):
+        """Serialisiert einmal für alle Abonnenten; unveränderte Werte werden nicht erneut gepusht"""
+        payload = json.dumps(data)
+        with self.cond:
+            current = self.events.get(name)
+            if current is not None and current[1] == payload:
+                self.stats['unchanged'] += 1
+                return
+            self.version += 1
+            self.events[name] = (self.version, payload, data)
+            self.stats['published'] += 1
+            self.cond.notify_all()
+    
+    def snapshot(self):
+        with self.cond:
+            return {name: data for name, (version, payload, data) in self.events.items()}
+    
+    def wait(self, seen_version, timeout):
+        """Blockiert bis es Neues gibt; gibt (Version, [(Name, JSON)]) zurück, Zwischenstände entfallen"""
+        with self.cond:
+            self.cond.wait_for(lambda: self.version > seen_version, timeout)
+            changed = sorted((version, name, payload) for name, (version, payload, data) in self.events.items()
+                             if version > seen_version)
+            self.stats['sent'] += len(changed)
+            return self.version, [(name, payload) for version, name, payload in changed]
+    
+    def add_subscriber(self, delta):
+        with self.cond:
+            self.subscribers += delta
+            self.stats['subscribers_peak'] = max(self.stats['subscribers_peak'], self.subscribers)
+
+push_hub = PushHub()
+headless_candles = {'data': CandleStore(), 'json': '[]'}
+
+def process_headless():
+    """Headless-Gegenstück zu process_queues: Mailboxen abholen und an den PushHub weitergeben"""
+    processed = 0
+    
+    for msg_type, data in price_queue.drain():
+        processed += 1
+        if data is None:
+            continue
+        if msg_type == 'bitcoin_price':
+            push_hub.publish('price', {'currency': get_currency_code(), 'price': data})
+            kraken_stream.record_display()
+        elif msg_type == 'opposite_price':
+            push_hub.publish('opposite_price', {'currency': "EUR" if CURRENCY == "USD" else "USD", 'price': data})
+    
+    for msg_type, data in historical_queue.drain():
+        processed += 1
+        if msg_type != 'historical_data' or not len(data):
+            continue
+        # Volle Kerzen nur über /candles (einmal serialisiert), per Push nur die letzte Kerze
+        headless_candles['data'] = data
+        headless_candles['json'] = json.dumps(data.to_array().tolist())
+        avg_mid_price, label_text = calculate_mid_price(data)
+        push_hub.publish('candle', {
+            'range': current_time_range,
+            'interval': TIME_RANGES[current_time_range]['interval'],
+            'count': len(data),
+            'last': data.to_array()[-1].tolist(),
+            'high': float(data.opens.max()),
+            'start_price': float(data.opens[0]),
+            'mid_price': avg_mid_price
+        })
+        # Headless entspricht der erste gepushte Kerzenstand dem ersten Chart
+        record_first_chart()
+    
+    for msg_type, data in fear_greed_queue.drain():
+        processed += 1
+        index, classification = data
+        push_hub.publish('fear_greed', {'index': index, 'classification': classification})
+    
+    for msg_type, data in fx_rate_queue.drain():
+        processed += 1
+        push_hub.publish('fx_rate', {'usd_eur': data, 'stale': fx_rate_service.get()[1]})
+    
+    return processed
+
+def get_app_stats():
+    """Messwerte aller Komponenten: headless unter /stats, im Fenster mit --stats beim Beenden"""
+    return {
+        'push': dict(push_hub.stats, subscribers=push_hub.subscribers),
+        'http': http_client.get_stats(),
+        'single_flight': single_flight.stats,
+        'ohlc_cache': ohlc_cache.get_stats(),
+        'stream': dict(kraken_stream.stats, healthy=kraken_stream.is_healthy()),
+        'dispatcher': ui_dispatcher.get_rates(),
+        'jobs': job_scheduler.get_stats(),
+        'cadence': cadence_controller.get_report(job_scheduler.get_stats()),
+        'rate_limits': rate_limiter.get_stats(),
+        'fx_rate': fx_rate_service.stats,
+        'startup': startup_stats,
+        'frames': animation_clock.get_frame_stats(),
+        'renderer': chart_renderer.stats if chart_renderer is not None else None,
+        'mailboxes': {name: dict(mailbox.stats) for name, mailbox in MAILBOXES.items()},
+        'visibility': visibility_monitor.get_report()
+    }
+
+class HeadlessRequestHandler(BaseHTTPRequestHandler):
+    """GET /snapshot, /candles, /stats (JSON) und /events (Server-Sent Events)"""
+    protocol_version = 'HTTP/1.1'
+    
+    def log_message(self, format, *args):
+        # Kein Logging pro Request
+        pass
+    
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == '/events':
+            self.send_events()
+        elif url.path == '/snapshot':
+            self.send_json(json.dumps(push_hub.snapshot()))
+        elif url.path == '/candles':
+            self.send_json(headless_candles['json'])
+        elif url.path == '/stats':
+            self.send_json(json.dumps(get_app_stats()))
+        else:
+            self.send_error(404)
+    
+    def send_json(self, body):
+        body = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def send_events(self):
+        """Erst der komplette aktuelle Stand, danach nur Änderungen; langsame Clients überspringen Zwischenstände"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.close_connection = True
+        
+        push_hub.add_subscriber(1)
+        seen_version = 0
+        try:
+            while True:
+                version, changed = push_hub.wait(seen_version, SSE_HEARTBEAT)
+                if changed:
+                    chunk = "".join(f"event: {name}\ndata: {payload}\n\n" for name, payload in changed)
+                else:
+                    chunk = ": heartbeat\n\n"
+                self.wfile.write(chunk.encode('utf-8'))
+                self.wfile.flush()
+                seen_version = version
+        except (OSError, ValueError):
+            # Client hat die Verbindung geschlossen
+            pass
+        finally:
+            push_hub.add_subscriber(-1)
+
+class HeadlessServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Standard-Backlog (5) verwirft bei vielen gleichzeitigen Verbindungen SYNs bzw. lehnt sie ab
+    request_queue_size = HEADLESS_BACKLOG
+
+def get_headless_port():
+    """--port N auf der Kommandozeile, sonst HEADLESS_PORT"""
+    if '--port' in sys.argv:
+        try:
+            return int(sys.argv[sys.argv.index('--port') + 1])
+        except (IndexError, ValueError):
+            pass
+    return HEADLESS_PORT
+
+def run_headless():
+    """Ein Poller für beliebig viele Dashboards: Pipeline wie im Fenster, Ausgabe über HTTP/SSE"""
+    load_options_from_file()
+    startup_stats['first_chart_source'] = 'network'
+    ui_dispatcher.attach_thread(process_headless)
+    
+    server = HeadlessServer((HEADLESS_HOST, get_headless_port()), HeadlessRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"BTC Pracker headless: http://{HEADLESS_HOST}:{server.server_port}/events")
+    
+    if STREAMING:
+        kraken_stream.start()
+    
+    schedule_polling_jobs()
+    prefetch_time_ranges()
+    
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        job_scheduler.stop()
+        kraken_stream.stop()
+        server.shutdown()
+        executor.shutdown(wait=False)
+        settings_store.flush()
+
 # ====== MAIN APPLICATION ======
+if __name__ == "__main__" and HEADLESS:
+    run_headless()
+    sys.exit(0)
+
 if __name__ == "__main__":
     # Load saved theme color
-    if os.path.exists(THEME_COLOR_FILE):
-        with open(THEME_COLOR_FILE, "r") as f:
-            saved_color = f.read().strip()
-            if saved_color:
-                theme_color = saved_color
+    saved_color = (settings_store.read(THEME_COLOR_FILE) or "").strip()
+    if saved_color:
+        theme_color = saved_color
     
     # Load all options
     load_options_from_file()
@@ -1537,19 +3739,9 @@ if __name__ == "__main__":
     canvas = FigureCanvasTkAgg(fig, master=root)
     canvas_widget = canvas.get_tk_widget()
     canvas_widget.place(x=0, y=65, width=620, height=320)
-    
-    def zoom(event):
-        scale_factor = 1.1 if event.delta > 0 else 0.9
-        xlim = ax.get_xlim()
-        ylim = ax.get_ylim()
-        x_data, y_data = ax.transData.inverted().transform((event.x, event.y))
-        ax.set_xlim([x_data - (x_data - xlim[0]) * scale_factor,
-                     x_data + (xlim[1] - x_data) * scale_factor])
-        ax.set_ylim([y_data - (y_data - ylim[0]) * scale_factor,
-                     y_data + (ylim[1] - y_data) * scale_factor])
-        canvas.draw()
-    
-    canvas_widget.bind("<MouseWheel>", zoom)
+    chart_renderer = ChartRenderer(ax, canvas)
+    zoom_controller = ZoomController(chart_renderer, canvas_widget)
+    zoom_controller.bind()
 
     # Time Range Dropdown
     time_range_var = tk.StringVar(root)
@@ -1660,19 +3852,35 @@ if __name__ == "__main__":
     usd_entry.bind("<KeyRelease>", update_usd_eur_conversion)
     eur_usd_entry.bind("<KeyRelease>", update_eur_usd_conversion)
     
+    # Chart sofort aus dem Disk-Cache zeichnen, das Netzwerk füllt danach nur die Lücke
+    ohlc_pair, ohlc_pair_key = get_ohlc_pair()
+    cached_data = get_candle_sync(ohlc_pair, ohlc_pair_key, TIME_RANGES[current_time_range]['interval']).load_cache()
+    if cached_data:
+        startup_stats['first_chart_source'] = 'cache'
+        plot_historical_prices_data(ax, cached_data)
+        loading_status.set_loaded('historical_data')
+    else:
+        startup_stats['first_chart_source'] = 'network'
+    
     # ====== WICHTIG: Zwinge COMPLETE RENDERING vor dem Welcome Screen ======
     root.update_idletasks()  # Zeichne alle Widgets
     root.update()           # Verarbeite alle Events
     
+    # Dispatcher schon jetzt: Callbacks der Worker (Ladefortschritt) laufen im Tk-Thread,
+    # die Mailboxen arbeitet er erst ab, wenn das Hauptfenster sichtbar ist
+    ui_dispatcher.attach(root, lambda: 0)
+    
     # Zeige Welcome Screen AN DER GLEICHEN POSITION wie Hauptfenster
     welcome = WelcomeScreen(root, x=main_window_x, y=main_window_y)
     
-    # Starte API Calls SOFORT
-    root.after(100, lambda: executor.submit(fetch_bitcoin_price_thread))
-    root.after(200, lambda: executor.submit(fetch_historical_prices_thread))
-    root.after(300, lambda: executor.submit(fetch_fear_greed_thread))
-    root.after(400, lambda: executor.submit(fetch_fx_rate_thread))
-    root.after(500, lambda: executor.submit(fetch_opposite_currency_price))
+    # Verbindungen vorwärmen während der Welcome Screen läuft
+    executor.submit(http_client.warm_up, 'https://api.kraken.com/0/public/Time')
+    executor.submit(http_client.warm_up, 'https://api.alternative.me/fng/?limit=1')
+    
+    # Starte API Calls SOFORT; danach hält der Scheduler alle Daten aktuell
+    schedule_polling_jobs()
+    if STREAMING:
+        root.after(400, kraken_stream.start)
     
     # Funktion um Hauptfenster zu zeigen
     def show_main_window():
@@ -1680,16 +3888,14 @@ if __name__ == "__main__":
         root.deiconify()
         root.focus_force()
         
-        # Starte Queue Processing
-        root.after(50, process_queues)
+        # Queue Processing: event-getrieben, nur wenn Worker etwas posten
+        ui_dispatcher.attach(root, process_queues)
+        
+        # Ab jetzt: im Hintergrund Chart pausieren und Polling drosseln
+        visibility_monitor.attach(root, canvas_widget)
         
-        # Starte regelmäßige Updates
-        root.after(1000, update_price_label_async)
-        root.after(2000, update_graph_async)
-        root.after(3000, update_fear_greed_async)
-        root.after(4000, update_rates_async)
-        root.after(5000, update_high_low_async)
-        root.after(6000, update_percentage_change_async)
+        # Übrige Zeiträume im Hintergrund vorladen
+        prefetch_time_ranges()
     
     root.show_main_window = show_main_window
     
@@ -0,0 +1,193 @@
+"""Gemeinsame Helfer der BTC-Pracker-Varianten (BTC-Pracker*.py)"""
+import queue
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+# ====== HEIKIN-ASHI ======
+# HA-Open-Rekursion ha_open[i] = (ha_open[i-1] + ha_close[i-1]) / 2 als Faltung mit 1/2, 1/4, ...
+# (nach 60 Schritten liegt das Gewicht unter der float64-Genauigkeit)
+HA_OPEN_WEIGHTS = np.concatenate(([0.0], 0.5 ** np.arange(1, 61)))
+
+def calculate_heikin_ashi(prices):
+    """Konvertiert OHLC-Daten vektorisiert zu Heikin-Ashi: Liste von (time, open, high, low, close)"""
+    if not prices:
+        return []
+    
+    opens = np.array([x[1] for x in prices])
+    highs = np.array([x[2] for x in prices])
+    lows = np.array([x[3] for x in prices])
+    closes = np.array([x[4] for x in prices])
+    
+    ha_closes = (opens + highs + lows + closes) / 4
+    ha_opens = np.convolve(ha_closes, HA_OPEN_WEIGHTS)[:len(prices)] + opens[0] * 0.5 ** np.arange(len(prices))
+    ha_highs = np.maximum(highs, np.maximum(ha_opens, ha_closes))
+    ha_lows = np.minimum(lows, np.minimum(ha_opens, ha_closes))
+    
+    return list(zip([x[0] for x in prices], ha_opens, ha_highs, ha_lows, ha_closes))
+
+def heikin_ashi_candle(candle, ha_open):
+    """Eine HA-Kerze aus (time, open, high, low, close) und dem HA-Open"""
+    time, open_price, high, low, close = candle[:5]
+    ha_close = (open_price + high + low + close) / 4
+    return (time, ha_open, max(high, ha_open, ha_close), min(low, ha_open, ha_close), ha_close)
+
+class HeikinAshiEngine:
+    """Hält die HA-Serie zu einer Kerzenliste; neue oder revidierte Kerzen kosten O(1)"""
+    def __init__(self):
+        self.series = deque()
+        self.stats = {'full': 0, 'incremental': 0}
+    
+    def update(self, prices):
+        """Gibt die HA-Serie (time, open, high, low, close) passend zu prices zurück"""
+        n = len(prices)
+        m = len(self.series)
+        series = self.series
+        if n >= 2 and m >= 2:
+            if n == m and prices[0][0] == series[0][0] and prices[-1][0] == series[-1][0]:
+                # Nur die offene Kerze hat sich geändert; ihr HA-Open bleibt
+                series[-1] = heikin_ashi_candle(prices[-1], series[-1][1])
+                self.stats['incremental'] += 1
+                return series
+            if prices[-2][0] == series[-1][0] and ((n == m + 1 and prices[0][0] == series[0][0])
+                                                   or (n == m and prices[0][0] == series[1][0])):
+                # Vorherige Kerze geschlossen, eine neue angefangen (Kraken schiebt das Fenster weiter)
+                series[-1] = heikin_ashi_candle(prices[-2], series[-1][1])
+                if n == m:
+                    series.popleft()
+                series.append(heikin_ashi_candle(prices[-1], (series[-1][1] + series[-1][4]) / 2))
+                self.stats['incremental'] += 1
+                return series
+        
+        self.series = deque(calculate_heikin_ashi(prices))
+        self.stats['full'] += 1
+        return self.series
+
+# ====== UI UPDATE BUS ======
+class UIUpdateBus:
+    """Widget-Updates aus beliebigen Threads; der Tk-Thread wendet sie gesammelt einmal pro Frame an"""
+    FRAME_TIME = 1 / 60
+    
+    def __init__(self):
+        self.root = None
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.calls = []
+        self.wake_pending = False
+        self.last_apply = 0.0
+        self.stats = {'posted': 0, 'applied': 0, 'skipped': 0, 'coalesced': 0, 'calls': 0, 'frames': 0}
+    
+    def attach(self, root):
+        """Verbindet den Bus mit dem Tk-Loop; bis dahin Gepostetes wird beim Start des Loops angewendet"""
+        self.root = root
+        root.bind('<<UIBusWake>>', self.on_wake)
+        # Vor dem Mainloop schlägt event_generate aus Worker-Threads fehl; dieser Frame holt es nach
+        root.after(0, self.apply)
+    
+    def post(self, widget, prop, value):
+        """Merkt (widget, prop) = value vor; ein neuerer Wert ersetzt einen noch nicht angewendeten"""
+        with self.lock:
+            key = (widget, prop)
+            if key in self.pending:
+                self.stats['coalesced'] += 1
+            self.pending[key] = value
+            self.stats['posted'] += 1
+        self.wake()
+    
+    def call(self, func, *args):
+        """func(*args) läuft im nächsten Frame im Tk-Thread (z.B. Chart zeichnen, Animation starten)"""
+        with self.lock:
+            self.calls.append((func, args))
+        self.wake()
+    
+    def wake(self):
+        """Höchstens ein Wake bis zum nächsten Frame, egal wie viele Threads posten"""
+        with self.lock:
+            if self.wake_pending or self.root is None:
+                return
+            self.wake_pending = True
+        try:
+            self.root.event_generate('<<UIBusWake>>', when='tail')
+        except Exception:
+            # Tk noch nicht/nicht mehr im Mainloop
+            with self.lock:
+                self.wake_pending = False
+    
+    def on_wake(self, event=None):
+        # Frame-Pacing: mehrere Wakes innerhalb eines Frames ergeben ein apply()
+        wait = self.FRAME_TIME - (time.perf_counter() - self.last_apply)
+        if wait > 0:
+            self.root.after(int(wait * 1000) + 1, self.apply)
+        else:
+            self.apply()
+    
+    def apply(self):
+        """Nur im Tk-Thread: erst die Callbacks, dann ein config() pro Widget ohne unveränderte Werte"""
+        with self.lock:
+            self.wake_pending = False
+            calls, self.calls = self.calls, []
+            pending, self.pending = self.pending, {}
+        self.last_apply = time.perf_counter()
+        self.stats['frames'] += 1
+        
+        for func, args in calls:
+            self.stats['calls'] += 1
+            try:
+                func(*args)
+            except Exception:
+                pass
+        
+        changes = {}
+        for (widget, prop), value in pending.items():
+            try:
+                unchanged = str(widget.cget(prop)) == str(value)
+            except Exception:
+                continue
+            if unchanged:
+                self.stats['skipped'] += 1
+            else:
+                changes.setdefault(widget, {})[prop] = value
+        
+        for widget, props in changes.items():
+            try:
+                widget.config(**props)
+                self.stats['applied'] += len(props)
+            except Exception:
+                # Widget wurde inzwischen zerstört
+                pass
+
+ui_bus = UIUpdateBus()
+
+# ====== BACKGROUND WORKER ======
+class BackgroundWorker:
+    """Ein gemeinsamer Worker-Thread für alle Netzwerkabfragen; wartet blockierend auf Aufträge statt zu pollen"""
+    def __init__(self, bus):
+        self.bus = bus
+        self.jobs = queue.Queue()
+        self.thread = None
+        self.lock = threading.Lock()
+    
+    def submit(self, fetch, callback):
+        """fetch() läuft im Worker, callback(Ergebnis) danach über den Bus im Tk-Thread (None bei Fehler)"""
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, daemon=True)
+                self.thread.start()
+        self.jobs.put((fetch, callback))
+    
+    def run(self):
+        while True:
+            fetch, callback = self.jobs.get()
+            try:
+                result = fetch()
+            except Exception:
+                result = None
+            self.bus.call(callback, result)
+
+background_worker = BackgroundWorker(ui_bus)
+
+def fetch_async(fetch, callback):
+    """Kurzform für background_worker.submit"""
+    background_worker.submit(fetch, callback)
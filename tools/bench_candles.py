@@ -0,0 +1,89 @@
+"""Benchmark: CandleStore gegen die frühere Liste aus (datetime, open, high, low, close)-Tupeln.
+
+Gemessen werden pro Größe die Parse-Zeit aus Krakens JSON-Zeilen, der Speicher (tracemalloc,
+alle Allokationen des Ergebnisses) und das Aufteilen in Spalten, wie es der Plotter braucht:
+
+    python tools/bench_candles.py --sizes 720 10000 1000000
+"""
+import argparse
+import gc
+import importlib.util
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def load_app():
+    """BTCPRefined ohne Tk/Matplotlib laden (wie im Headless-Modus)"""
+    sys.argv.append('--headless')
+    spec = importlib.util.spec_from_file_location('btcp', os.path.join(ROOT, 'BTCPRefined.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def make_rows(count):
+    """Zeilen wie in Krakens OHLC-Antwort: [time, open, high, low, close, vwap, volume, count]"""
+    start = 1700000000
+    return [[start + 60 * i, f'{90000 + i % 500:.1f}', f'{90010 + i % 500:.1f}', f'{89990 + i % 500:.1f}',
+             f'{90005 + i % 500:.1f}', f'{90002 + i % 500:.1f}', '1.25000000', 42] for i in range(count)]
+
+def parse_tuples(rows):
+    """Der frühere Weg aus fetch_historical_prices_thread"""
+    historical_data = []
+    for price in rows:
+        try:
+            historical_data.append((
+                datetime.fromtimestamp(int(price[0])),
+                float(price[1]),
+                float(price[2]),
+                float(price[3]),
+                float(price[4])
+            ))
+        except (ValueError, IndexError):
+            continue
+    return historical_data
+
+def split_tuples(historical_data):
+    return ([x[0] for x in historical_data], [x[1] for x in historical_data], [x[2] for x in historical_data],
+            [x[3] for x in historical_data], [x[4] for x in historical_data])
+
+def split_store(candles):
+    return candles.times, candles.opens, candles.highs, candles.lows, candles.closes
+
+def measure(func, *args):
+    """(Ergebnis, Sekunden, Bytes) - Zeit und Speicher in getrennten Läufen, tracemalloc bremst"""
+    gc.collect()
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    del result
+    gc.collect()
+    tracemalloc.start()
+    result = func(*args)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, elapsed, size
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[720, 10000, 1000000])
+    args = parser.parse_args()
+    app = load_app()
+
+    print(f"{'Kerzen':>9} | {'Parse Tupel':>11} {'CandleStore':>11} | {'Speicher Tupel':>14} {'CandleStore':>11}"
+          f" | {'Spalten Tupel':>13} {'CandleStore':>11}")
+    for count in args.sizes:
+        rows = make_rows(count)
+        tuples, tuple_time, tuple_bytes = measure(parse_tuples, rows)
+        store, store_time, store_bytes = measure(app.CandleStore.from_kraken, rows)
+        _, tuple_split, _ = measure(split_tuples, tuples)
+        _, store_split, _ = measure(split_store, store)
+        print(f"{count:>9} | {tuple_time * 1000:>8.1f} ms {store_time * 1000:>8.1f} ms"
+              f" | {tuple_bytes / 1024:>11.0f} KB {store_bytes / 1024:>8.0f} KB"
+              f" | {tuple_split * 1000:>10.2f} ms {store_split * 1000:>8.3f} ms")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""Benchmark: gemeinsamer Keep-Alive-Client (http_client) gegen einzelne requests.get-Aufrufe.
+
+Ein lokaler HTTPS-Ersatz für api.kraken.com beantwortet /0/public/Ticker und zählt die
+TLS-Handshakes. --rtt simuliert die Netzwerklaufzeit (ein TLS-1.3-Handshake kostet TCP + TLS,
+also etwa zwei Roundtrips, jeder Request einen weiteren):
+
+    python tools/bench_http_client.py --requests 50 --rtt 30
+
+Das Zertifikat wird mit dem openssl-Kommandozeilentool erzeugt (oder --cert/--key angeben).
+"""
+import argparse
+import importlib.util
+import json
+import os
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TICKER = json.dumps({'error': [], 'result': {
+    'XXBTZEUR': {'c': ['92000.0', '0.01']}, 'XXBTZUSD': {'c': ['106800.0', '0.01']}, 'USDTEUR': {'c': ['0.8614', '10']}
+}}).encode()
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Antwortet wie Krakens Ticker; eine Instanz pro Verbindung, d.h. pro Handshake"""
+    protocol_version = 'HTTP/1.1'
+    # Header und Body in einem Segment, sonst bremst Nagle + Delayed ACK jeden Request um ~40 ms
+    wbufsize = 65536
+
+    def setup(self):
+        super().setup()
+        self.server.stats['handshakes'] += 1
+        # TCP- und TLS-Handshake: zwei Roundtrips
+        time.sleep(2 * self.server.rtt)
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        time.sleep(self.server.rtt)
+        self.server.stats['requests'] += 1
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(TICKER)))
+        self.end_headers()
+        self.wfile.write(TICKER)
+
+def make_certificate(directory):
+    cert = os.path.join(directory, 'cert.pem')
+    key = os.path.join(directory, 'key.pem')
+    subprocess.run(['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+                    '-subj', '/CN=127.0.0.1', '-addext', 'subjectAltName=IP:127.0.0.1',
+                    '-keyout', key, '-out', cert], check=True, capture_output=True)
+    return cert, key
+
+def start_server(cert, key, rtt):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+    server.daemon_threads = True
+    server.rtt = rtt
+    server.stats = {'handshakes': 0, 'requests': 0}
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def load_app():
+    """BTCPRefined ohne Tk/Matplotlib laden (wie im Headless-Modus)"""
+    sys.argv.append('--headless')
+    spec = importlib.util.spec_from_file_location('btcp', os.path.join(ROOT, 'BTCPRefined.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def measure(server, get, url, count):
+    server.stats.update(handshakes=0, requests=0)
+    times = []
+    for _ in range(count):
+        start = time.perf_counter()
+        get(url).json()
+        times.append(time.perf_counter() - start)
+    return times, dict(server.stats)
+
+def report(name, times, stats):
+    times_ms = sorted(t * 1000 for t in times)
+    print(f"{name:<18} {sum(times_ms) / len(times_ms):8.1f} ms mittel {times_ms[0]:8.1f} ms min"
+          f" {times_ms[-1]:8.1f} ms max   {stats['handshakes']:3d} Handshakes / {stats['requests']} Requests")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=50)
+    parser.add_argument('--rtt', type=float, default=30, help='simulierte Laufzeit in ms')
+    parser.add_argument('--cert')
+    parser.add_argument('--key')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cert, key = (args.cert, args.key) if args.cert else make_certificate(directory)
+        # requests prüft gegen dieses Zertifikat, auch in den Sessions des http_client
+        os.environ['REQUESTS_CA_BUNDLE'] = cert
+        server = start_server(cert, key, args.rtt / 1000)
+        url = f'https://127.0.0.1:{server.server_port}/0/public/Ticker?pair=XBTEUR,XBTUSD,USDTEUR'
+
+        app = load_app()
+        import requests
+
+        print(f"{args.requests} Requests, simulierte RTT {args.rtt:.0f} ms")
+        times, stats = measure(server, lambda u: requests.get(u, timeout=5), url, args.requests)
+        report('requests.get', times, stats)
+        app.http_client.warm_up(url)
+        times, stats = measure(server, app.http_client.get, url, args.requests)
+        report('http_client.get', times, stats)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark: Kerzen zeichnen mit draw_candles (zwei vlines-Collections) gegen die frühere
+Schleife mit drei ax.plot-Aufrufen pro Kerze, jeweils inklusive vollem Redraw (Agg, 620x320):
+
+    python tools/bench_render.py --sizes 720 5000 20000
+
+Die Schleife wird ab --loop-limit Kerzen übersprungen (bei 20k dauert sie mehrere Sekunden).
+"""
+import argparse
+import importlib.util
+import os
+import sys
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def load_app():
+    """BTCPRefined ohne Tk laden (wie im Headless-Modus); draw_candles braucht nur eine Achse"""
+    sys.argv.append('--headless')
+    spec = importlib.util.spec_from_file_location('btcp', os.path.join(ROOT, 'BTCPRefined.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def make_candles(count):
+    rng = np.random.default_rng(1)
+    dates = 19700 + np.arange(count) / 1440
+    closes = 90000 + np.cumsum(rng.normal(0, 20, count))
+    opens = np.r_[closes[0], closes[:-1]]
+    highs = np.maximum(opens, closes) + rng.random(count) * 15
+    lows = np.minimum(opens, closes) - rng.random(count) * 15
+    return dates, opens, highs, lows, closes
+
+def draw_loop(ax, dates, opens, highs, lows, closes, bullish_color, bearish_color):
+    """Die frühere Schleife aus plot_historical_prices_data"""
+    for i in range(len(dates)):
+        color = bullish_color if closes[i] >= opens[i] else bearish_color
+        ax.plot([dates[i], dates[i]], [opens[i], closes[i]], color=color, linewidth=1.0, solid_capstyle='round')
+        ax.plot([dates[i], dates[i]], [highs[i], max(opens[i], closes[i])], color=color, linewidth=0.6)
+        ax.plot([dates[i], dates[i]], [min(opens[i], closes[i]), lows[i]], color=color, linewidth=0.6)
+
+def measure(fig, ax, draw, repeat):
+    """Bester von repeat Läufen: Achse leeren, Kerzen anlegen, Figur rendern"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ax.clear()
+        draw()
+        fig.canvas.draw()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, len(ax.lines) + len(ax.collections)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[720, 5000, 20000])
+    parser.add_argument('--loop-limit', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    app = load_app()
+
+    fig, ax = plt.subplots(figsize=(6.2, 3.2), dpi=100)
+    print(f"{'Kerzen':>7} | {'Schleife':>10} {'Artists':>8} | {'draw_candles':>12} {'Artists':>8} | {'pro Kerze':>9}")
+    for count in args.sizes:
+        candles = make_candles(count)
+        if count <= args.loop_limit:
+            loop_time, loop_artists = measure(fig, ax, lambda: draw_loop(
+                ax, *candles, app.bullish_color, app.bearish_color), args.repeat)
+            loop_text = f"{loop_time * 1000:>7.0f} ms {loop_artists:>8}"
+        else:
+            loop_text = f"{'-':>10} {'-':>8}"
+        fast_time, fast_artists = measure(fig, ax, lambda: app.draw_candles(ax, *candles), args.repeat)
+        print(f"{count:>7} | {loop_text} | {fast_time * 1000:>9.0f} ms {fast_artists:>8}"
+              f" | {fast_time / count * 1e6:>6.1f} µs")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""Lasttest für den Headless-Modus: viele SSE-Abonnenten gegen /events.
+
+Ein laufender Server wird vorausgesetzt, z.B. mit dem WebSocket-Ersatz als Datenquelle:
+
+    python tools/kraken_ws_replay.py --port 8766 --speed 4
+    KRAKEN_WS_URL=ws://127.0.0.1:8766 python BTCPRefined.py --headless --port 8765
+    python tools/headless_load_test.py --subscribers 300 --seconds 20
+
+Gemessen wird pro Abonnent die Zahl der Events und pro Preis-Update die Spanne vom ersten bis
+zum letzten Abonnenten, der es erhalten hat (Fan-out). Alle Verbindungen liest ein Thread.
+"""
+import argparse
+import json
+import selectors
+import socket
+import statistics
+import time
+import urllib.request
+from urllib.parse import urlsplit
+
+def get_push_stats(base_url):
+    with urllib.request.urlopen(base_url + '/stats', timeout=5) as response:
+        return json.load(response)['push']
+
+def connect(host, port):
+    sock = socket.create_connection((host, port), timeout=5)
+    sock.sendall(f'GET /events HTTP/1.1\r\nHost: {host}\r\nAccept: text/event-stream\r\n\r\n'.encode())
+    sock.setblocking(False)
+    return sock
+
+def parse_events(buffer):
+    """Trennt vollständige SSE-Blöcke ab; gibt ([(Name, Daten)], Rest) zurück"""
+    events = []
+    while b'\n\n' in buffer:
+        block, buffer = buffer.split(b'\n\n', 1)
+        name = data = None
+        for line in block.decode('utf-8', 'replace').split('\n'):
+            if line.startswith('event: '):
+                name = line[7:]
+            elif line.startswith('data: '):
+                data = line[6:]
+        if name is not None:
+            events.append((name, data))
+    return events, buffer
+
+def run(base_url, subscribers, seconds):
+    url = urlsplit(base_url)
+    selector = selectors.DefaultSelector()
+    clients = []
+
+    start = time.perf_counter()
+    for index in range(subscribers):
+        client = {'sock': connect(url.hostname, url.port or 80), 'buffer': b'', 'events': {}, 'bytes': 0}
+        clients.append(client)
+        selector.register(client['sock'], selectors.EVENT_READ, client)
+    connect_time = time.perf_counter() - start
+    # Gezählt wird erst, wenn alle verbunden sind (der Anfangsstand kommt sofort)
+    measuring_from = time.perf_counter() + 1.0
+    before = None
+
+    # Pro Preis-Payload: erste und letzte Ankunft über alle Abonnenten
+    arrivals = {}
+    closed = 0
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end and closed < subscribers:
+        for key, _ in selector.select(timeout=0.5):
+            client = key.data
+            try:
+                chunk = client['sock'].recv(65536)
+            except BlockingIOError:
+                continue
+            if not chunk:
+                selector.unregister(client['sock'])
+                closed += 1
+                continue
+            now = time.perf_counter()
+            events, client['buffer'] = parse_events(client['buffer'] + chunk)
+            if now < measuring_from:
+                continue
+            if before is None:
+                before = get_push_stats(base_url)
+                end = now + seconds
+            client['bytes'] += len(chunk)
+            for name, data in events:
+                client['events'][name] = client['events'].get(name, 0) + 1
+                if name == 'price':
+                    first, last, count = arrivals.get(data, (now, now, 0))
+                    arrivals[data] = (first, now, count + 1)
+
+    during = get_push_stats(base_url)
+    before = before or during
+    for client in clients:
+        client['sock'].close()
+
+    prices = sorted(client['events'].get('price', 0) for client in clients)
+    # Nur Updates, die alle Abonnenten erreicht haben, zählen für die Fan-out-Spanne
+    spreads = [(last - first) * 1000 for first, last, count in arrivals.values() if count == subscribers]
+    coverage = [count / subscribers * 100 for first, last, count in arrivals.values()]
+    print(f"Abonnenten:            {subscribers} (verbunden in {connect_time:.2f} s, Server-Peak {during['subscribers_peak']})")
+    print(f"Veröffentlicht:        {during['published'] - before['published']} Events in {seconds:.0f} s")
+    print(f"Preis-Events/Abonnent: min {prices[0]}, median {statistics.median(prices):.0f}, max {prices[-1]}")
+    print(f"Empfangen gesamt:      {sum(client['bytes'] for client in clients) / 1024:.0f} KB")
+    if coverage:
+        print(f"Abdeckung:             {statistics.median(coverage):.0f} % der Abonnenten pro Preis-Update (median),"
+              f" Zwischenstände überspringt der PushHub für langsame Leser")
+    if spreads:
+        print(f"Fan-out (ms):          median {statistics.median(spreads):.1f}, max {max(spreads):.1f}"
+              f" über {len(spreads)} Preis-Updates")
+    if closed:
+        print(f"Vorzeitig geschlossen: {closed}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', default='http://127.0.0.1:8765')
+    parser.add_argument('--subscribers', type=int, default=300)
+    parser.add_argument('--seconds', type=float, default=20)
+    args = parser.parse_args()
+    run(args.url.rstrip('/'), args.subscribers, args.seconds)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,231 @@
+"""Lokaler Ersatz für Krakens WebSocket (v1): spielt aufgezeichnete Nachrichten ab.
+
+Damit läuft der Stream-Modus von BTCPRefined.py offline, und die Latenz vom Tick bis zum
+Label lässt sich reproduzierbar messen:
+
+    python tools/kraken_ws_replay.py --port 8766
+    KRAKEN_WS_URL=ws://127.0.0.1:8766 python BTCPRefined.py --headless
+
+Aufnahme einer neuen Sitzung vom echten Endpunkt (braucht websocket-client):
+
+    python tools/kraken_ws_replay.py --record session.jsonl --seconds 120
+
+Format der Aufnahme: eine JSON-Zeile pro Nachricht, {"t": Sekunden seit Start, "msg": Nachricht}.
+"""
+import argparse
+import base64
+import hashlib
+import json
+import os
+import socketserver
+import struct
+import threading
+import time
+
+WS_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+DEFAULT_RECORDING = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'kraken_ws_sample.jsonl')
+STREAM_PAIRS = ['XBT/EUR', 'XBT/USD', 'USDT/EUR']
+
+def load_recording(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def get_channel(message):
+    """(Kanalname, Pair) einer Datennachricht, None für Events und Heartbeats"""
+    if isinstance(message, list) and len(message) >= 4:
+        return message[-2], message[-1]
+    return None
+
+def shift_candle(message, shift):
+    """Verschiebt time/etime einer OHLC-Nachricht, auf ganze Intervalle ausgerichtet"""
+    interval = int(message[2].split('-')[1]) * 60
+    shift -= shift % interval
+    payload = list(message[1])
+    payload[0] = f'{float(payload[0]) + shift:.6f}'
+    payload[1] = f'{float(payload[1]) + shift:.6f}'
+    return [message[0], payload, message[2], message[3]]
+
+class ReplayHandler(socketserver.BaseRequestHandler):
+    """Eine WebSocket-Verbindung: Handshake, Abos annehmen, Aufnahme im Takt abspielen"""
+    def setup(self):
+        self.send_lock = threading.Lock()
+        self.subscriptions = set()
+        self.closed = threading.Event()
+
+    def handle(self):
+        if not self.handshake():
+            return
+        self.send_json({'connectionID': id(self), 'event': 'systemStatus', 'status': 'online', 'version': 'replay'})
+        threading.Thread(target=self.read_loop, daemon=True).start()
+        try:
+            self.replay()
+        except OSError:
+            pass
+        self.closed.set()
+
+    def handshake(self):
+        data = b''
+        while b'\r\n\r\n' not in data:
+            chunk = self.request.recv(4096)
+            if not chunk:
+                return False
+            data += chunk
+        headers = {}
+        for line in data.decode('latin-1').split('\r\n')[1:]:
+            if ':' in line:
+                name, value = line.split(':', 1)
+                headers[name.strip().lower()] = value.strip()
+        key = headers.get('sec-websocket-key')
+        if key is None:
+            return False
+        accept = base64.b64encode(hashlib.sha1((key + WS_GUID).encode()).digest()).decode()
+        self.request.sendall(('HTTP/1.1 101 Switching Protocols\r\n'
+                              'Upgrade: websocket\r\nConnection: Upgrade\r\n'
+                              f'Sec-WebSocket-Accept: {accept}\r\n\r\n').encode())
+        return True
+
+    def send_frame(self, opcode, payload):
+        length = len(payload)
+        if length < 126:
+            header = struct.pack('!BB', 0x80 | opcode, length)
+        elif length < 65536:
+            header = struct.pack('!BBH', 0x80 | opcode, 126, length)
+        else:
+            header = struct.pack('!BBQ', 0x80 | opcode, 127, length)
+        with self.send_lock:
+            self.request.sendall(header + payload)
+
+    def send_json(self, message):
+        self.send_frame(0x1, json.dumps(message).encode())
+
+    def recv_exact(self, size):
+        data = b''
+        while len(data) < size:
+            chunk = self.request.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError
+            data += chunk
+        return data
+
+    def read_loop(self):
+        """Client-Frames (maskiert): subscribe, ping, close"""
+        try:
+            while not self.closed.is_set():
+                first, second = self.recv_exact(2)
+                opcode = first & 0x0F
+                length = second & 0x7F
+                if length == 126:
+                    length = struct.unpack('!H', self.recv_exact(2))[0]
+                elif length == 127:
+                    length = struct.unpack('!Q', self.recv_exact(8))[0]
+                mask = self.recv_exact(4) if second & 0x80 else b'\0\0\0\0'
+                payload = bytes(b ^ mask[i % 4] for i, b in enumerate(self.recv_exact(length)))
+                if opcode == 0x8:
+                    self.send_frame(0x8, b'')
+                    break
+                if opcode == 0x9:
+                    self.send_frame(0xA, payload)
+                elif opcode == 0x1:
+                    self.handle_request(json.loads(payload))
+        except (OSError, ConnectionError, ValueError):
+            pass
+        self.closed.set()
+
+    def handle_request(self, request):
+        if request.get('event') == 'ping':
+            self.send_json({'event': 'pong', 'reqid': request.get('reqid')})
+            return
+        if request.get('event') != 'subscribe':
+            return
+        subscription = request.get('subscription', {})
+        name = subscription.get('name')
+        if name == 'ohlc':
+            name = f"ohlc-{subscription.get('interval', 1)}"
+        for pair in request.get('pair', []):
+            self.subscriptions.add((name, pair))
+            self.send_json({'channelName': name, 'event': 'subscriptionStatus', 'pair': pair,
+                            'status': 'subscribed', 'subscription': subscription})
+
+    def replay(self):
+        """Spielt die Aufnahme im aufgezeichneten Takt (geteilt durch speed) ab, auf Wunsch endlos"""
+        messages = self.server.messages
+        candle_times = [float(m['msg'][1][1]) for m in messages
+                        if (get_channel(m['msg']) or ('',))[0].startswith('ohlc')]
+        while not self.closed.is_set():
+            # Kerzenzeiten an die aktuelle Uhrzeit anpassen, sonst verwirft die App sie als veraltet
+            shift = time.time() - max(candle_times) if candle_times else 0
+            start = time.monotonic()
+            for entry in messages:
+                delay = entry['t'] / self.server.speed - (time.monotonic() - start)
+                if delay > 0 and self.closed.wait(delay):
+                    return
+                message = entry['msg']
+                channel = get_channel(message)
+                if channel is None:
+                    self.send_json(message)
+                elif channel in self.subscriptions:
+                    if channel[0].startswith('ohlc'):
+                        message = shift_candle(message, shift)
+                    self.send_json(message)
+                    self.server.stats['sent'] += 1
+            if not self.server.loop:
+                return
+
+class ReplayServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, messages, speed=1.0, loop=True):
+        super().__init__(address, ReplayHandler)
+        self.messages = messages
+        self.speed = speed
+        self.loop = loop
+        self.stats = {'sent': 0}
+
+def record(path, seconds, url='wss://ws.kraken.com'):
+    """Zeichnet die Nachrichten der Abos von BTCPRefined.py auf"""
+    import websocket
+    ws = websocket.create_connection(url, timeout=5)
+    ws.send(json.dumps({'event': 'subscribe', 'pair': STREAM_PAIRS, 'subscription': {'name': 'ticker'}}))
+    ws.send(json.dumps({'event': 'subscribe', 'pair': STREAM_PAIRS[:2],
+                        'subscription': {'name': 'ohlc', 'interval': 1}}))
+    start = time.monotonic()
+    count = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        while time.monotonic() - start < seconds:
+            try:
+                raw = ws.recv()
+            except websocket.WebSocketTimeoutException:
+                continue
+            message = json.loads(raw)
+            # Status-Events erzeugt der Ersatzserver selbst
+            if isinstance(message, dict) and message.get('event') != 'heartbeat':
+                continue
+            f.write(json.dumps({'t': round(time.monotonic() - start, 3), 'msg': message}) + '\n')
+            count += 1
+    ws.close()
+    print(f'{count} Nachrichten in {path}')
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--recording', default=DEFAULT_RECORDING)
+    parser.add_argument('--speed', type=float, default=1.0, help='Abspieltempo (2 = doppelt so schnell)')
+    parser.add_argument('--once', action='store_true', help='Aufnahme nur einmal abspielen')
+    parser.add_argument('--record', metavar='PATH', help='vom echten Endpunkt aufzeichnen statt abzuspielen')
+    parser.add_argument('--seconds', type=float, default=60)
+    args = parser.parse_args()
+
+    if args.record:
+        record(args.record, args.seconds)
+        return
+
+    server = ReplayServer(('127.0.0.1', args.port), load_recording(args.recording), args.speed, not args.once)
+    print(f'Replay auf ws://127.0.0.1:{args.port} ({len(server.messages)} Nachrichten)')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()